@@ -0,0 +1,139 @@
+"""
+benchmarks of the hot paths of easyplot
+
+every public module in this directory defines benchmarks as functions decorated with parameterize
+a benchmark is called with one of its parameters and returns the function to time, so setup is not timed
+run with python -m benchmarks (see __main__)
+
+baseline.json holds reference results, with the machine and versions they were measured with in its meta
+regressions are detected with python -m benchmarks -b benchmarks/baseline.json
+timings only compare on similar machines; after a change of hardware or of a dependency,
+regenerate the baseline with python -m benchmarks -o benchmarks/baseline.json on the machine that runs the comparison
+"""
+import importlib
+import os
+import platform
+import statistics
+import sys
+import time
+
+
+def parameterize(*params):
+    """
+    register a function as benchmark
+    :param params: values the function is called with; tuples are passed as separate arguments
+    """
+    def decorator(func):
+        func.params = params
+        return func
+    return decorator
+
+
+def collect(pattern=None):
+    """
+    find all benchmarks in this package
+    :param pattern: substring that the name (module.function) of a benchmark must contain
+    :return: list of (name, function)
+    """
+    root = os.path.split(__file__)[0]
+    found = []
+    for f in sorted(os.listdir(root)):
+        name, ext = os.path.splitext(f)
+        # skip private modules
+        if f.startswith('_') or ext != '.py':
+            continue
+        m = importlib.import_module('.'+name, package=__name__)
+        for k, v in vars(m).items():
+            if callable(v) and hasattr(v, 'params') and getattr(v, '__module__', None) == m.__name__:
+                fullname = '{}.{}'.format(name, k)
+                if pattern is None or pattern in fullname:
+                    found.append((fullname, v))
+    return found
+
+
+def param_name(p):
+    if isinstance(p, tuple):
+        return '-'.join(str(v) for v in p)
+    return str(p)
+
+
+def _smallest(params):
+    """parameters with the smallest size; the size is the last value of a tuple"""
+    size = lambda p: p[-1] if isinstance(p, tuple) else p
+    smallest = min(size(p) for p in params)
+    return [p for p in params if size(p) == smallest]
+
+
+def timeit(func, repeat=5, min_time=.05):
+    """
+    time a function
+    each of the repeats calls the function as often as needed to take at least min_time
+    :return: dict with the min and median time per call in seconds
+    """
+    # calibrate the number of calls per repeat
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 2**20:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time/elapsed) + 1)
+
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0)/number)
+    return dict(min=min(times), median=statistics.median(times), number=number, repeat=repeat)
+
+
+def run(pattern=None, quick=False, repeat=5, min_time=.05, log=None):
+    """
+    run the benchmarks
+    :param pattern: only run benchmarks with this substring in their name
+    :param quick: only use the smallest size of each benchmark
+    :param log: function called with a line of text after each benchmark
+    :return: results as dict with meta data and results by name[parameter]
+    """
+    results = dict()
+    for name, bench in collect(pattern):
+        params = _smallest(bench.params) if quick else bench.params
+        for p in params:
+            func = bench(*p) if isinstance(p, tuple) else bench(p)
+            key = '{}[{}]'.format(name, param_name(p))
+            results[key] = r = timeit(func, repeat=repeat, min_time=min_time)
+            if log is not None:
+                log('{:60s} {:10.3f} ms'.format(key, 1e3*r['min']))
+    return dict(meta=meta(), results=results)
+
+
+def meta():
+    import numpy
+    import matplotlib
+    return dict(
+        python=sys.version.split()[0],
+        numpy=numpy.__version__,
+        matplotlib=matplotlib.__version__,
+        platform=platform.platform(),
+        time=time.strftime('%Y-%m-%dT%H:%M:%S'))
+
+
+def compare(results, baseline, tolerance=1.25, key='min'):
+    """
+    compare results with a baseline
+    :param tolerance: a benchmark regressed if its time exceeds the baseline times this factor
+    :param key: time of the results that is compared
+    :return: list of (name, ratio, regressed) for benchmarks present in both
+    """
+    r = []
+    for k, v in results['results'].items():
+        try:
+            base = baseline['results'][k]
+        except KeyError:
+            continue
+        ratio = v[key]/base[key] if base[key] > 0 else float('inf')
+        r.append((k, ratio, ratio > tolerance))
+    return r
@@ -0,0 +1,41 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import argparse
+import json
+import sys
+from . import run, compare
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='benchmark the hot paths of easyplot')
+    parser.add_argument('-k', '--filter', default=None, help='only run benchmarks with this text in their name')
+    parser.add_argument('-o', '--output', default=None, help='write the results to this json file')
+    parser.add_argument('-b', '--baseline', default=None, help='compare with the results in this json file, e.g. benchmarks/baseline.json')
+    parser.add_argument('-t', '--tolerance', type=float, default=1.25,
+                        help='slowdown relative to the baseline that counts as regression (default 1.25)')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of repeats (default 5)')
+    parser.add_argument('-q', '--quick', action='store_true', help='only run the smallest size of each benchmark')
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, quick=args.quick, repeat=args.repeat, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = 0
+    for name, ratio, regressed in compare(results, baseline, tolerance=args.tolerance):
+        if regressed:
+            regressions += 1
+        print('{:60s} {:6.2f}x {}'.format(name, ratio, 'REGRESSION' if regressed else ''))
+    print('{} regressions'.format(regressions))
+    return 1 if regressions else 0
+
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,43 @@
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+# dataset types with the number of values used for the benchmarks
+TYPES = ('Timeseries', 'Points', 'ValuePoints', 'Grid', 'IrregularGrid', 'VectorData')
+SIZES = (10**4, 10**6)
+
+
+def arrays(dataset_type, size, seed=0):
+    """
+    arrays for a dataset with about size values per axis
+    the values are random but the same for each run
+    """
+    rng = np.random.RandomState(seed)
+    n = int(np.sqrt(size))
+    if dataset_type == 'Timeseries':
+        t = np.arange(size, dtype=float)
+        return [t, np.cumsum(rng.randn(size))]
+    if dataset_type == 'Points':
+        return [rng.rand(size), rng.rand(size)]
+    if dataset_type == 'ValuePoints':
+        return [rng.rand(size), rng.rand(size), rng.rand(size)]
+    if dataset_type == 'Grid':
+        return [np.arange(n, dtype=float), np.arange(n, dtype=float), rng.rand(n, n)]
+    if dataset_type == 'IrregularGrid':
+        y, x = np.mgrid[:n, :n].astype(float)
+        return [x + .1*y, y - .1*x, rng.rand(n, n)]
+    if dataset_type == 'VectorData':
+        return [np.arange(n, dtype=float), np.arange(n, dtype=float), rng.randn(n, n), rng.randn(n, n)]
+    raise ValueError('unknown dataset type {!r}'.format(dataset_type))
+
+
+def dataset(dataset_type, size):
+    from easyplot import datasets
+    return getattr(datasets, dataset_type)(*arrays(dataset_type, size))
+
+
+def figure(figsize=(8, 6), dpi=100):
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig
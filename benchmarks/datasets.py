@@ -0,0 +1,20 @@
+from easyplot import datasets
+from . import parameterize
+from ._data import TYPES, SIZES, arrays, dataset
+
+
+@parameterize(*[(t, n) for t in TYPES for n in SIZES])
+def interpret_datatype(dataset_type, size):
+    axes = arrays(dataset_type, size)
+    return lambda: datasets.interpret_datatype(*axes)
+
+
+@parameterize(*[(t, n) for t in TYPES for n in SIZES])
+def limits(dataset_type, size):
+    d = dataset(dataset_type, size)
+
+    def func():
+        # limits are cached with the dataset, the benchmark measures computing them
+        d.invalidate()
+        d.limits()
+    return func
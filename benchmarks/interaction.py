@@ -0,0 +1,241 @@
+"""
+latency of scripted interactions with EasyPlotWidget
+
+interactions are replayed on a widget without a display (QT_QPA_PLATFORM=offscreen)
+the latency of a step is the time from the start of the interaction until the redraw it requested is shown
+run with python -m benchmarks.interaction
+"""
+from collections import OrderedDict
+import argparse
+import json
+import os
+import sys
+import time
+from . import compare, meta
+
+
+def percentile(values, q):
+    """percentile of a list of values with linear interpolation"""
+    values = sorted(values)
+    pos = (len(values) - 1)*q/100
+    i = int(pos)
+    if i + 1 >= len(values):
+        return values[-1]
+    return values[i] + (values[i+1] - values[i])*(pos - i)
+
+
+class Harness(object):
+    """
+    replays interactions on an EasyPlotWidget and records the latency of each step
+    """
+
+    def __init__(self, datasets, redraw_delay=0, background_render=False, size=(1000, 700), timeout=30.):
+        """
+        :param datasets: datasets shown in the dataset selector
+        :param redraw_delay: debounce time of the widget (see RedrawScheduler)
+        :param background_render: render on a worker thread (see BackgroundRenderer)
+        :param timeout: maximum time in seconds for a step
+        """
+        # the platform has to be chosen before the application is created
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt4 import QtGui
+        from easyplot import gui
+
+        self.app = QtGui.QApplication.instance() or QtGui.QApplication([])
+        self.widget = gui.EasyPlotWidget(*datasets, redraw_delay=redraw_delay, background_render=background_render)
+        self.widget.resize(*size)
+        self.widget.show()
+        self.timeout = timeout
+
+        # draws of the figure on the gui thread
+        self.canvas_draws = 0
+        self.widget.canvas.mpl_connect('draw_event', self._count_draw)
+
+        self.latencies = OrderedDict()
+        self.wait()
+
+    def _count_draw(self, event):
+        self.canvas_draws += 1
+
+    def frames(self):
+        """number of frames shown by the canvas"""
+        renderer = self.widget.background_renderer
+        if renderer is not None:
+            return renderer.frames
+        return self.canvas_draws
+
+    def wait(self, requests=None, frames=None):
+        """
+        process events until the scheduler is idle and, if a redraw was requested, a new frame is shown
+        :param requests: number of redraw requests before the step
+        :param frames: number of frames before the step
+        """
+        scheduler = self.widget.redraw
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            self.app.processEvents()
+            idle = not scheduler.timer.isActive() and not scheduler.dirty
+            requested = requests is not None and scheduler.requests > requests
+            if idle and (not requested or self.frames() > frames):
+                return
+            if time.perf_counter() > deadline:
+                raise RuntimeError('no frame shown within {} s'.format(self.timeout))
+            time.sleep(.0005)
+
+    def step(self, name, action):
+        """
+        perform an interaction and wait for the result to be shown
+        :param action: function called with the widget
+        :return: latency in seconds
+        """
+        requests, frames = self.widget.redraw.requests, self.frames()
+        t0 = time.perf_counter()
+        action(self.widget)
+        self.wait(requests, frames)
+        dt = time.perf_counter() - t0
+        self.latencies.setdefault(name, []).append(dt)
+        return dt
+
+    def replay(self, steps, repeat=1, setup=None):
+        """
+        :param steps: list of (name, action)
+        :param setup: action performed (and not timed) before each replay
+        """
+        for _ in range(repeat):
+            if setup is not None:
+                requests, frames = self.widget.redraw.requests, self.frames()
+                setup(self.widget)
+                self.wait(requests, frames)
+            for name, action in steps:
+                self.step(name, action)
+
+    def report(self):
+        """
+        latency percentiles in seconds of each step and the draw counts of the widget
+        """
+        scheduler = self.widget.redraw
+        results = OrderedDict()
+        for name, values in self.latencies.items():
+            results[name] = dict(
+                count=len(values),
+                p50=percentile(values, 50),
+                p90=percentile(values, 90),
+                p99=percentile(values, 99),
+                max=max(values))
+        return dict(
+            meta=meta(),
+            results=results,
+            draws=dict(
+                requests=scheduler.requests,
+                draws=scheduler.draws,
+                suppressed=scheduler.suppressed,
+                frames=self.frames()))
+
+    def close(self):
+        if self.widget.background_renderer is not None:
+            self.widget.background_renderer.shutdown()
+        self.widget.close()
+        self.widget.deleteLater()
+
+
+# interactions
+
+def add_dataset(index):
+    """select a dataset in the dataset selector and add it to the current axes"""
+    def action(widget):
+        selector = widget.dataset_selector
+        selector.list_widget.clearSelection()
+        selector.list_widget.topLevelItem(index).setSelected(True)
+        selector.add()
+    return action
+
+
+def set_ax_count(n):
+    """enter the number of axes in the figure settings"""
+    def action(widget):
+        field = widget.fig_settings_widget.axnum_field
+        field.set_value(n)
+        field.changed()
+    return action
+
+
+def edit_color(color):
+    """enter a color in the settings of the current layer"""
+    def action(widget):
+        field = widget.plot_stack.fields['color']
+        field.set_value(color)
+        field.changed()
+        layer = widget.figure_manager.gca().layers.gcl()
+        if layer['kwargs'].get('color') != color:
+            raise AssertionError('color of the current layer not changed to {!r}'.format(color))
+    return action
+
+
+def remove_layers(widget):
+    """remove all layers and use a single axes"""
+    widget.fig_settings_widget.set_ax_count(1)
+    for a in widget.figure_manager.axes:
+        del a.layers[:]
+    widget.plot()
+
+
+def default_steps():
+    return [
+        ('add grid', add_dataset(1)),
+        ('add timeseries', add_dataset(0)),
+        ('edit color', edit_color('r')),
+        ('edit color', edit_color('b')),
+        ('set axes count', set_ax_count(2)),
+        ('set axes count', set_ax_count(1))]
+
+
+def default_datasets(size):
+    from easyplot import datasets
+    from ._data import arrays
+    return [datasets.Timeseries(*arrays('Timeseries', size)),
+            datasets.Grid(*arrays('Grid', size))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.interaction',
+                                     description='latency of interactions with the easyplot widget')
+    parser.add_argument('-n', '--repeat', type=int, default=10, help='number of replays of the interactions')
+    parser.add_argument('-s', '--size', type=int, default=10**6, help='number of values of the datasets')
+    parser.add_argument('-d', '--delay', type=int, default=0, help='redraw delay in ms')
+    parser.add_argument('--background', action='store_true', help='render on a worker thread')
+    parser.add_argument('-o', '--output', default=None, help='write the results to this json file')
+    parser.add_argument('-b', '--baseline', default=None, help='compare the median latency with this json file')
+    parser.add_argument('-t', '--tolerance', type=float, default=1.5,
+                        help='slowdown relative to the baseline that counts as regression (default 1.5)')
+    args = parser.parse_args(argv)
+
+    harness = Harness(default_datasets(args.size), redraw_delay=args.delay, background_render=args.background)
+    try:
+        harness.replay(default_steps(), repeat=args.repeat, setup=remove_layers)
+        results = harness.report()
+    finally:
+        harness.close()
+
+    for name, r in results['results'].items():
+        print('{:20s} p50 {:8.1f} ms  p90 {:8.1f} ms  p99 {:8.1f} ms  max {:8.1f} ms'.format(
+            name, *(1e3*r[k] for k in ('p50', 'p90', 'p99', 'max'))))
+    print('{requests} redraw requests, {draws} draws, {suppressed} suppressed, {frames} frames'.format(
+        **results['draws']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = [name for name, _, regressed in compare(results, baseline, args.tolerance, key='p50') if regressed]
+    for name in regressions:
+        print('regression: {}'.format(name))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,73 @@
+from contextlib import redirect_stdout
+import io
+import matplotlib.style
+from easyplot.managers import FigureManager, LayersContainer
+from . import parameterize
+from ._data import TYPES, SIZES, dataset, figure
+
+
+@parameterize(*[(t, n) for t in TYPES for n in SIZES])
+def layers_plot(dataset_type, size):
+    """plot a layer on empty axes"""
+    ax = figure().add_subplot(111)
+    layers = LayersContainer(dataset(dataset_type, size))
+
+    def func():
+        ax.clear()
+        layers.forget_artists()
+        layers.plot(ax)
+    return func
+
+
+@parameterize(1, 10)
+def layers_plot_incremental(count):
+    """plot layers of which one changed a setting that can be applied to the existing artists"""
+    ax = figure().add_subplot(111)
+    layers = LayersContainer(*[dataset('Timeseries', 10**4) for _ in range(count)])
+    layers.plot(ax)
+
+    colors = ['r', 'b']
+
+    def func():
+        colors.reverse()
+        layers.edit(0, color=colors[0])
+        layers.plot(ax)
+    return func
+
+
+@parameterize(1, 10)
+def apply_settings(count):
+    figman = FigureManager(figure())
+    figman.set_ax_count(count)
+    for a in figman.axes:
+        a.format(xlim=(0, 10), ylim=(0, 1), xlabel='x', ylabel='y', title='title')
+
+    def func():
+        for a in figman.axes:
+            a.apply_settings()
+    return func
+
+
+@parameterize(4, 16)
+def set_ax_count(count):
+    figman = FigureManager(figure())
+    counts = [count, count - 1]
+
+    def func():
+        counts.reverse()
+        figman.set_ax_count(counts[0], reset=False)
+    return func
+
+
+@parameterize(1, 4)
+def set_style(count):
+    figman = FigureManager(figure())
+    figman.set_ax_count(count)
+    styles = ['ggplot', 'default']
+
+    def func():
+        styles.reverse()
+        # set_style changes the global style and prints the axes data
+        with matplotlib.style.context('default'), redirect_stdout(io.StringIO()):
+            figman.set_style(styles[0])
+    return func
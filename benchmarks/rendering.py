@@ -0,0 +1,29 @@
+from easyplot import rendering
+from easyplot.managers import FigureManager
+from . import parameterize
+from ._data import TYPES, SIZES, dataset, figure
+
+
+def _figure_with(dataset_type, size):
+    figman = FigureManager(figure())
+    axman = figman.axes[0]
+    d = dataset(dataset_type, size)
+    axman.layers.add(d)
+    xlim, ylim = d.limits()
+    axman.check_limits(xlim=xlim, ylim=ylim)
+    axman.plot()
+    return figman.fig
+
+
+@parameterize(*[(t, n) for t in TYPES for n in SIZES])
+def draw(dataset_type, size):
+    """full Agg draw of a figure with a single layer"""
+    fig = _figure_with(dataset_type, size)
+    return fig.canvas.draw
+
+
+@parameterize(('Timeseries', 10**4), ('Grid', 10**6))
+def render_rgba(dataset_type, size):
+    """draw and copy the frame as used by background rendering"""
+    fig = _figure_with(dataset_type, size)
+    return lambda: rendering.render_rgba(fig)
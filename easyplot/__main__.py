@@ -1,25 +1,38 @@
-from PyQt4 import QtGui
-from . import gui
 import sys
 
-from .datasets import interpret_datatype
-import numpy as np
 
-app = QtGui.QApplication([])
+def run_gui():
+    from PyQt4 import QtGui
+    from . import gui
 
-w = gui.EasyPlotWidget(
-    interpret_datatype(
-        np.arange(10),
-        5*np.random.rand(10)),
-    interpret_datatype(
-        np.arange(10),
-        np.arange(10),
-        np.random.rand(10, 10),
-        np.random.rand(10, 10)))
-w.show()
+    from .datasets import interpret_datatype
+    import numpy as np
 
-exit_code = app.exec_()
+    app = QtGui.QApplication([])
 
-w.deleteLater()
+    w = gui.EasyPlotWidget(
+        interpret_datatype(
+            np.arange(10),
+            5*np.random.rand(10)),
+        interpret_datatype(
+            np.arange(10),
+            np.arange(10),
+            np.random.rand(10, 10),
+            np.random.rand(10, 10)))
+    w.show()
 
-sys.exit(exit_code)
\ No newline at end of file
+    exit_code = app.exec_()
+
+    w.deleteLater()
+
+    return exit_code
+
+
+def main(argv):
+    if argv and argv[0] == 'render':
+        from . import batch
+        return batch.main(argv[1:])
+    return run_gui()
+
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,56 @@
+import numpy as np
+
+
+def bin_indices(x, y, xlim, ylim, shape):
+    """
+    flat index of the raster cell of each point
+    :param xlim: (x0, x1); x0 is the left edge of the first column, the limits may be in decreasing order
+    :param ylim: (y0, y1); y0 is the lower edge of the first row
+    :param shape: (rows, columns) of the raster
+    :return: (idx, mask) with the index of each point inside the raster and the mask of those points
+    """
+    ny, nx = shape
+    with np.errstate(invalid='ignore'):
+        # NaN coordinates become an invalid (negative) index
+        col = np.floor((x - xlim[0])*(nx/(xlim[1] - xlim[0])))
+        row = np.floor((y - ylim[0])*(ny/(ylim[1] - ylim[0])))
+        mask = (col >= 0) & (col < nx) & (row >= 0) & (row < ny)
+    return row[mask].astype(np.intp)*nx + col[mask].astype(np.intp), mask
+
+
+def rasterize(x, y, xlim, ylim, shape, values=None, statistic='count'):
+    """
+    aggregate points into a raster in a single pass over the points
+    :param values: value of each point; required for all statistics but count
+    :param statistic: 'count', 'mean', 'min' or 'max'
+    :return: 2d float array with the statistic of each cell; NaN for cells without points
+    """
+    idx, mask = bin_indices(x, y, xlim, ylim, shape)
+    size = shape[0]*shape[1]
+
+    if statistic == 'count':
+        result = np.bincount(idx, minlength=size).astype(float)
+        result[result == 0] = np.nan
+        return result.reshape(shape)
+
+    if values is None:
+        raise ValueError('values required for {!r}'.format(statistic))
+    values = values[mask]
+    # points with a NaN value are ignored
+    valid = ~np.isnan(values)
+    idx, values = idx[valid], values[valid]
+
+    counts = np.bincount(idx, minlength=size)
+    if statistic == 'mean':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = np.bincount(idx, weights=values, minlength=size)/counts
+    elif statistic == 'min':
+        result = np.full(size, np.inf)
+        np.minimum.at(result, idx, values)
+    elif statistic == 'max':
+        result = np.full(size, -np.inf)
+        np.maximum.at(result, idx, values)
+    else:
+        raise ValueError('unknown statistic {!r}'.format(statistic))
+    result[counts == 0] = np.nan
+    return result.reshape(shape)
@@ -0,0 +1,140 @@
+"""
+headless rendering of figures from a layout description and dataset files
+
+the layout is a json file with the following (optional) keys:
+    axes      number of axes (default 1)
+    rows      number of rows of axes (default 1)
+    style     matplotlib style name
+    figsize   [width, height] in inches
+    dpi       resolution of the output
+    settings  list of axes settings (see AxesManager.format) for each axes
+    layers    list of layers, each a dict with
+                axes    index of the axes (default 0)
+                arrays  names of the arrays in the dataset file (default all arrays in the file)
+                type    name of the dataset class (default interpreted from the arrays)
+                kwargs  plot arguments
+
+each dataset file (.npz or .npy) is rendered to its own figure
+"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.style
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+import argparse
+import json
+import os
+import sys
+from . import datasets, storage
+from .managers import FigureManager
+
+
+def load_layout(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_arrays(path):
+    """load the arrays of a dataset file as memory maps by name"""
+    if os.fsdecode(path).endswith('.npz'):
+        return storage.load_npz(path)
+    return OrderedDict(arr_0=storage.load_npy(path))
+
+
+def create_dataset(arrays, layer):
+    """create the dataset for a layer from the arrays of a dataset file"""
+    names = layer.get('arrays') or list(arrays.keys())
+    axes = [arrays[n] for n in names]
+    if 'type' in layer:
+        return getattr(datasets, layer['type'])(*axes)
+    return datasets.interpret_datatype(*axes)
+
+
+def build_figure(layout, path):
+    """
+    create a figure with the layout and the dataset file
+    :return: FigureManager
+    """
+    fig = Figure(figsize=layout.get('figsize'), dpi=layout.get('dpi'))
+    FigureCanvasAgg(fig)
+
+    figman = FigureManager(fig)
+    figman.set_axrow_count(layout.get('rows', 1))
+    figman.set_ax_count(layout.get('axes', 1))
+
+    arrays = load_arrays(path)
+    for layer in layout.get('layers') or [dict()]:
+        axman = figman.axes[layer.get('axes', 0)]
+        d = create_dataset(arrays, layer)
+        axman.layers.add(d, **layer.get('kwargs', dict()))
+        xlim, ylim = d.limits()
+        axman.check_limits(xlim=xlim, ylim=ylim)
+
+    for axman, settings in zip(figman.axes, layout.get('settings', [])):
+        axman.format(**settings)
+
+    for axman in figman.axes:
+        axman.plot()
+    return figman
+
+
+def render_job(layout, path, output):
+    """
+    render a single figure to a file; the format follows from the extension of output
+    :return: output
+    """
+    with matplotlib.style.context(layout.get('style', 'default')):
+        figman = build_figure(layout, path)
+        figman.fig.savefig(output)
+    return output
+
+
+def output_path(path, outdir, fmt):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(outdir, '{}.{}'.format(name, fmt))
+
+
+def render_jobs(layout, paths, outdir, fmt='png', workers=None):
+    """
+    render a figure for each dataset file on a pool of processes
+    :param workers: number of processes (default: number of cpus)
+    :return: list of (path, output, error) in the order of paths; error is None on success
+    """
+    os.makedirs(outdir, exist_ok=True)
+    outputs = [output_path(p, outdir, fmt) for p in paths]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_job, layout, p, o) for p, o in zip(paths, outputs)]
+        for p, o, f in zip(paths, outputs, futures):
+            try:
+                f.result()
+            except Exception as e:
+                results.append((p, o, e))
+            else:
+                results.append((p, o, None))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m easyplot render', description='render figures without a gui')
+    parser.add_argument('layout', help='json file with the layout of the figure')
+    parser.add_argument('datasets', nargs='+', help='.npz or .npy files; one figure per file')
+    parser.add_argument('-o', '--outdir', default='.', help='directory for the figures')
+    parser.add_argument('-f', '--format', default='png', choices=['png', 'pdf'], help='output format')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='number of processes (default: cpu count)')
+    args = parser.parse_args(argv)
+
+    results = render_jobs(load_layout(args.layout), args.datasets, args.outdir, fmt=args.format, workers=args.workers)
+
+    failed = 0
+    for path, output, error in results:
+        if error is None:
+            print('{} -> {}'.format(path, output))
+        else:
+            failed += 1
+            print('{} failed: {!r}'.format(path, error), file=sys.stderr)
+    return 1 if failed else 0
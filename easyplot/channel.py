@@ -0,0 +1,199 @@
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+import struct
+import json
+import os
+from . import datasets
+
+
+# shared memory layout:
+#   spec length   uint64
+#   spec          json with dataset type, sequence offset and the dtype, shape and offset of each array
+#   sequence      uint64; odd while the producer writes, increased by 2 for every publication
+#   arrays        raw array data, each starting at a multiple of ALIGNMENT
+ALIGNMENT = 64
+_LENGTH = struct.Struct('<Q')
+
+# names of the blocks created by writers in this process
+_created = set()
+
+
+def _aligned(offset):
+    return offset + (-offset % ALIGNMENT)
+
+
+class ChannelWriter(object):
+    """
+    producer side of a channel that publishes a fixed set of arrays through shared memory
+    """
+
+    def __init__(self, arrays, dataset_type=None, name=None):
+        """
+        :param arrays: list of (shape, dtype) for each array
+        :param dataset_type: name of the dataset class the reader creates (default: interpreted from the arrays)
+        :param name: name of the shared memory block (default: generated)
+        """
+        specs = []
+        offset = 0
+        for shape, dtype in arrays:
+            dtype = np.dtype(dtype)
+            specs.append(dict(shape=list(shape), dtype=dtype.str, offset=offset))
+            offset = _aligned(offset + int(np.prod(shape))*dtype.itemsize)
+
+        # the offsets depend on the size of the spec, so the offsets are made absolute afterwards
+        # reserving room for the (at most 20) extra digits of each offset
+        spec = dict(type=dataset_type, arrays=specs, sequence=0)
+        header_size = _aligned(_LENGTH.size + len(json.dumps(spec)) + 20*(len(specs) + 1))
+        spec['sequence'] = header_size
+        for s in specs:
+            s['offset'] += header_size + ALIGNMENT
+        spec_bytes = json.dumps(spec).encode('utf-8')
+
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=header_size + ALIGNMENT + max(offset, 1))
+        _created.add(self.shm.name)
+        self.shm.buf[:_LENGTH.size] = _LENGTH.pack(len(spec_bytes))
+        self.shm.buf[_LENGTH.size:_LENGTH.size+len(spec_bytes)] = spec_bytes
+
+        self._sequence = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=spec['sequence'])
+        self._sequence[0] = 0
+        self.arrays = [np.ndarray(tuple(s['shape']), dtype=np.dtype(s['dtype']), buffer=self.shm.buf,
+                                  offset=s['offset']) for s in specs]
+
+    @classmethod
+    def like(cls, *arrays, **kwargs):
+        """create a channel for arrays with the shapes and dtypes of the given arrays"""
+        return cls([(a.shape, a.dtype) for a in arrays], **kwargs)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def publish(self, *arrays):
+        """copy new values for all arrays into shared memory and advance the sequence counter"""
+        if len(arrays) != len(self.arrays):
+            raise ValueError('{} arrays required'.format(len(self.arrays)))
+        self._sequence[0] += 1
+        for dst, src in zip(self.arrays, arrays):
+            dst[...] = src
+        self._sequence[0] += 1
+
+    def close(self, unlink=True):
+        del self._sequence, self.arrays
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+            _created.discard(self.shm.name)
+
+
+def _empty_aligned(shape, dtype):
+    """uninitialized array whose data starts at a multiple of ALIGNMENT, like the arrays in shared memory"""
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape))*dtype.itemsize
+    buf = np.empty(size + ALIGNMENT, dtype=np.uint8)
+    offset = -buf.ctypes.data % ALIGNMENT
+    return buf[offset:offset+size].view(dtype).reshape(shape)
+
+
+class ChannelReader(object):
+    """
+    consumer side of a channel
+
+    by default the arrays are private copies of the last complete publication:
+    poll copies the shared arrays and only accepts the copy if the sequence counter did not change meanwhile,
+    so the producer can not overwrite data that is being drawn (a seqlock)
+    every accepted publication gets new arrays, so arrays that are still drawn, e.g. by a snapshot of the figure
+    on another thread, are never overwritten
+    with copy=False the arrays are zero-copy views of the shared memory instead;
+    a publication during a draw then shows partly old and partly new data, which must be acceptable to the caller
+    """
+
+    def __init__(self, name, copy=True):
+        """
+        :param name: name of the shared memory block of the writer
+        :param copy: keep private copies of the arrays (see class docstring)
+        """
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # python < 3.13 registers attached blocks and would remove them when this process exits
+            # a block created in this process is registered by its writer, which removes it
+            self.shm = shared_memory.SharedMemory(name=name)
+            if self.shm.name not in _created and os.name == 'posix':
+                # blocks are registered with a leading slash
+                resource_tracker.unregister('/' + self.shm.name, 'shared_memory')
+
+        length, = _LENGTH.unpack(bytes(self.shm.buf[:_LENGTH.size]))
+        self.spec = json.loads(bytes(self.shm.buf[_LENGTH.size:_LENGTH.size+length]).decode('utf-8'))
+
+        self._sequence = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=self.spec['sequence'])
+        self._shared = []
+        for s in self.spec['arrays']:
+            a = np.ndarray(tuple(s['shape']), dtype=np.dtype(s['dtype']), buffer=self.shm.buf, offset=s['offset'])
+            a.flags.writeable = False
+            self._shared.append(a)
+
+        self.copy = copy
+        # a copy that was not accepted; it was never handed out, so the next poll can copy into it again
+        self._pending = None
+        if copy:
+            self.arrays = [_empty_aligned(a.shape, a.dtype) for a in self._shared]
+            for a in self.arrays:
+                a[...] = 0
+                a.flags.writeable = False
+        else:
+            self.arrays = self._shared
+
+        # number of the last accepted publication
+        self.received = 0
+        self._dataset = None
+
+    @property
+    def sequence(self):
+        """number of completed publications"""
+        return int(self._sequence[0]) // 2
+
+    def poll(self):
+        """
+        check if a publication was completed since the last poll and accept it
+        the axes of the dataset (if created) are replaced by the new arrays and the dataset is invalidated,
+        so cached properties are computed again
+        :return: False if there is no new publication or the producer is writing
+        """
+        seq = int(self._sequence[0])
+        if seq % 2 or seq // 2 == self.received:
+            return False
+        if self.copy:
+            pending = self._pending or [_empty_aligned(a.shape, a.dtype) for a in self._shared]
+            for dst, src in zip(pending, self._shared):
+                dst[...] = src
+            if int(self._sequence[0]) != seq:
+                # the producer wrote while copying; the next poll tries again
+                self._pending = pending
+                return False
+            for a in pending:
+                a.flags.writeable = False
+            self.arrays, self._pending = pending, None
+        self.received = seq // 2
+        if self._dataset is not None:
+            # the axes are replaced before the cache is cleared, so the new cache is only filled from the new axes
+            self._dataset.axes = list(self.arrays)
+            self._dataset.invalidate()
+        return True
+
+    def dataset(self, **kwargs):
+        """
+        dataset with the arrays of the channel as axes; created once
+        :param kwargs: passed to the dataset
+        """
+        if self._dataset is None:
+            dataset_type = self.spec.get('type')
+            if dataset_type is None:
+                self._dataset = datasets.interpret_datatype(*self.arrays, **kwargs)
+            else:
+                self._dataset = getattr(datasets, dataset_type)(*self.arrays, **kwargs)
+        return self._dataset
+
+    def close(self):
+        self._dataset = None
+        del self._sequence, self._shared, self._pending, self.arrays
+        self.shm.close()
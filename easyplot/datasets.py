@@ -1,6 +1,10 @@
 import numpy as np
 from collections import ChainMap
-from matplotlib import cm
+from functools import partial
+from . import aggregation, decimation, spatial, storage
+
+# matplotlib (and view, which depends on it) is imported when plotting,
+# so datasets can be created and analysed without the import cost of matplotlib
 
 
 class InvalidAxes(Exception):
@@ -9,6 +13,102 @@ class InvalidAxes(Exception):
     """
 
 
+def nanminmax(a, chunksize=2**18):
+    """
+    calculate the minimum and maximum of an array ignoring NaN in a single pass
+    the array is reduced in chunks, so both reductions of a chunk read it while it is still in cache
+    :param a: numpy array
+    :param chunksize: number of elements per chunk
+    :return: (vmin, vmax); NaN if the array is empty or contains only NaN
+    """
+    flat = a.ravel(order='K')
+    if flat.size == 0:
+        return np.nan, np.nan
+
+    vmin = vmax = flat[0]
+    for start in range(0, flat.size, chunksize):
+        chunk = flat[start:start+chunksize]
+        # fmin and fmax only return NaN if both values are NaN
+        vmin = np.fmin(vmin, np.fmin.reduce(chunk))
+        vmax = np.fmax(vmax, np.fmax.reduce(chunk))
+    return vmin, vmax
+
+
+def _reduce_blocks(z, reduce, chunksize=2**18):
+    """
+    combine blocks of 2 by 2 values of a 2d array ignoring NaN
+    the array is reduced in bands of rows, so temporary arrays are limited to the size of a band
+    :param z: 2d array with an even number of rows and columns
+    :param reduce: 'mean', 'min' or 'max'
+    :param chunksize: number of elements of z per band
+    :return: array of half the size of z in both directions; NaN where a block has only NaN
+    """
+    if reduce not in ('mean', 'min', 'max'):
+        raise ValueError('unknown reduction {!r}'.format(reduce))
+    ny, nx = z.shape[0] // 2, z.shape[1] // 2
+    blocks = z.reshape(ny, 2, nx, 2)
+    dtype = z.dtype if reduce != 'mean' or np.issubdtype(z.dtype, np.floating) else np.float64
+    result = np.empty((ny, nx), dtype=dtype)
+    rows = max(chunksize // max(4*nx, 1), 1)
+    for start in range(0, ny, rows):
+        band = blocks[start:start+rows]
+        if reduce == 'mean':
+            count = np.count_nonzero(~np.isnan(band), axis=(1, 3))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[start:start+rows] = np.nansum(band, axis=(1, 3), dtype=np.float64)/count
+        elif reduce == 'min':
+            result[start:start+rows] = np.fmin.reduce(np.fmin.reduce(band, axis=3), axis=1)
+        else:
+            result[start:start+rows] = np.fmax.reduce(np.fmax.reduce(band, axis=3), axis=1)
+    return result
+
+
+def _overlapping_chunks(v, chunksize):
+    """iterate over chunks of a 1d array that overlap by one element, so all steps are in a chunk"""
+    for start in range(0, v.size - 1, chunksize):
+        yield v[start:start+chunksize+1]
+
+
+def _index_range(v, lim, increasing, pad=1):
+    """
+    find the range of indices of an increasing 1d array with values inside the limits with a binary search
+    :param lim: (vmin, vmax) in any order
+    :param increasing: whether v is increasing; if not, the entire range is returned
+    :param pad: number of values outside the limits to include on both sides
+    :return: (start, stop)
+    """
+    if not increasing:
+        return 0, v.size
+    vmin, vmax = sorted(lim)
+    start = max(np.searchsorted(v, vmin, side='left') - pad, 0)
+    stop = min(np.searchsorted(v, vmax, side='right') + pad, v.size)
+    return int(start), int(stop)
+
+
+def _nearest_index(v, value, equidistant, increasing):
+    """
+    find the index of the value of a 1d array nearest to a value
+    equidistant arrays use arithmetic, increasing arrays a binary search; other arrays are not supported
+    :return: index or None if the value is more than half a step outside the array or the array is not supported
+    """
+    n = v.size
+    if n == 0:
+        return None
+    if equidistant and n > 1:
+        i = int(np.floor((value - v[0])/(v[-1] - v[0])*(n - 1) + .5))
+        return i if 0 <= i < n else None
+    if not increasing:
+        return None
+
+    i = int(np.searchsorted(v, value))
+    if i == n or (i > 0 and value - v[i-1] < v[i] - value):
+        i -= 1
+    # outside the array only values within half the outer step belong to the outer value
+    if n > 1 and (value < v[0] - (v[1] - v[0])/2 or value > v[-1] + (v[-1] - v[-2])/2):
+        return None
+    return i
+
+
 class Dataset(object):
     """
     object for handling a set of numpy arrays that together form a dataset
@@ -28,10 +128,11 @@ class Dataset(object):
 
     def __init__(self, *args, names=None):
         # store the axes as a list of numpy arrays
+        # arrays (including memory maps) and objects supporting the buffer protocol are not copied
         axes = []
         for a in args:
             if not isinstance(a, np.ndarray):
-                a = np.array(a)
+                a = np.asarray(a)
             axes.append(a)
 
         # check the axes against this dataset type
@@ -40,6 +141,80 @@ class Dataset(object):
         self.axes = axes
         self.names = names or self.DEFAULT_NAMES
 
+    @classmethod
+    def from_npy(cls, *paths, mmap=True, **kwargs):
+        """
+        create a dataset from .npy files, one for each axis
+        :param mmap: memory map the arrays, so only the parts that are used are read from disk
+        """
+        return cls(*[storage.load_npy(p, mmap=mmap) for p in paths], **kwargs)
+
+    @classmethod
+    def from_npz(cls, path, keys=None, mmap=True, **kwargs):
+        """
+        create a dataset from the arrays in a .npz file
+        :param keys: names of the arrays to use as axes; defaults to DEFAULT_NAMES if all are present
+                     and to the order of the archive otherwise
+        :param mmap: memory map the arrays if they are stored uncompressed
+        """
+        arrays = storage.load_npz(path, mmap=mmap)
+        if keys is None:
+            if all(k in arrays for k in cls.DEFAULT_NAMES):
+                keys = cls.DEFAULT_NAMES
+            else:
+                keys = list(arrays.keys())
+        return cls(*[arrays[k] for k in keys], **kwargs)
+
+    @property
+    def axes(self):
+        return self._axes
+    @axes.setter
+    def axes(self, axes):
+        self._axes = axes
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        clear all properties computed from the axes
+        must be called after the data of the axes is changed in place
+        the version is increased, so artists that depend on the data can detect the change
+        """
+        self._cache = dict()
+        self.version = getattr(self, 'version', 0) + 1
+
+    def axis_increasing(self, i):
+        """check if a 1d axis is increasing; cached until the axes change"""
+        return self._scan_axis('is_increasing', i)
+
+    def axis_equidistant(self, i):
+        """check if a 1d axis is equidistant; cached until the axes change"""
+        return self._scan_axis('is_equidistant', i)
+
+    def _cached(self, key, compute):
+        """
+        get a property computed from the axes, computed on first use
+        the cache may be filled from a render thread (see FigureManager.snapshot):
+        a value computed while the dataset is invalidated goes into the discarded cache, not the new one
+        :param compute: function without arguments computing the value
+        """
+        cache = self._cache
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = result = compute()
+            return result
+
+    def _scan_axis(self, name, i):
+        return self._cached((name, i), lambda: getattr(self, name)(self.axes[i]))
+
+    def extrema(self, i):
+        """
+        minimum and maximum of an axis ignoring NaN
+        computed once and cached until the axes change
+        :param i: index of the axis
+        :return: (vmin, vmax)
+        """
+        return self._cached(('extrema', i), lambda: nanminmax(self.axes[i]))
 
     def plot(self, **kwargs):
         """plot the data"""
@@ -72,9 +247,15 @@ class Dataset(object):
                         overruled by yunit=auto
         :return: (np.array([xmin, xmax]), np.array([ymin, ymax])
         """
-        x, y = self.axes[0], self.axes[1]
-        xmin, xmax, ymin, ymax = x.min(), x.max(), y.min(), y.max()
+        (xmin, xmax), (ymin, ymax) = self.extrema(0), self.extrema(1)
+        return self._format_limits(xmin, xmax, ymin, ymax,
+                                   xunit=xunit, yunit=yunit, xmargin=xmargin, ymargin=ymargin)
 
+    def _format_limits(self, xmin, xmax, ymin, ymax, xunit=None, yunit=None, xmargin=None, ymargin=None):
+        """
+        round data extrema to limits according to the configuration arguments (see _limits)
+        :return: (np.array([xmin, xmax]), np.array([ymin, ymax])
+        """
         if xunit is not None:
             if xunit == 'auto':
                 # get largest decimal as unit
@@ -155,13 +336,78 @@ class Dataset(object):
         """
         return .5
 
+    @classmethod
+    def has_signature(cls, axes):
+        """quick check of the number of axes and their dimensions, without looking at the data"""
+        if len(axes) != len(cls.DIMENSIONS):
+            return False
+        return all(getattr(a, 'ndim', None) == n for a, n in zip(axes, cls.DIMENSIONS))
+
     @staticmethod
-    def is_equidistant(v, margin=1e-5):
-        return v.ndim == 1 and (v.min() - np.diff(v) < margin).all()
+    def is_equidistant(v, margin=1e-5, chunksize=2**16):
+        """
+        check if all steps of a 1d array are equal to the first step
+        a sample of the array is checked first, after which the array is scanned in chunks until a step differs
+        :param margin: allowed deviation of a step relative to the first step
+        """
+        if v.ndim != 1:
+            return False
+        if v.size < 3:
+            return True
+
+        step = v[1] - v[0]
+        if step == 0:
+            return False
+        tol = margin*abs(step)
+
+        # a deviation in the sample can be at most the sum of the deviations of the steps in between
+        idx = np.linspace(0, v.size - 1, min(v.size, 1024)).astype(int)
+        if not (np.abs(v[idx] - v[0] - idx*step) <= 2*(idx + 1)*tol).all():
+            return False
+
+        for chunk in _overlapping_chunks(v, chunksize):
+            if not (np.abs(np.diff(chunk) - step) <= tol).all():
+                return False
+        return True
 
     @staticmethod
-    def is_increasing(v):
-        return v.ndim == 1 and (np.diff(v) > 0).all()
+    def is_increasing(v, chunksize=2**16):
+        """
+        check if a 1d array is strictly increasing
+        a sample of the array is checked first, after which the array is scanned in chunks until a step is not positive
+        """
+        if v.ndim != 1:
+            return False
+        if v.size < 2:
+            return True
+
+        sample = v[::max(v.size // 1024, 1)]
+        if not (sample[1:] > sample[:-1]).all():
+            return False
+
+        for chunk in _overlapping_chunks(v, chunksize):
+            if not (chunk[1:] > chunk[:-1]).all():
+                return False
+        return True
+
+    def index_at(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """
+        find the data at a location, e.g. of the mouse
+        :param scale: (sx, sy) number of pixels per data unit
+        :param maxdist: maximum distance in pixels for datasets of discrete points
+        :return: index into each axis or None if the dataset has no data at the location
+        """
+        return None
+
+    def readout(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """
+        values of all axes at a location (see index_at)
+        :return: list of (name, value) or None
+        """
+        indices = self.index_at(x, y, scale=scale, maxdist=maxdist)
+        if indices is None:
+            return None
+        return [(n, a[i]) for (n, a), i in zip(self, indices)]
 
     def __iter__(self):
         for i, a in enumerate(self.axes):
@@ -176,8 +422,133 @@ class Timeseries(Dataset):
     DEFAULT_NAMES = ('t', 'v')
     LAYER_NAME = 'timeseries.plot'
 
-    def plot(self, ax, **kwargs):
-        return ax.plot(self.axes[0], self.axes[1], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+    # number of points per horizontal pixel of the axes when the series is decimated
+    DECIMATION_DENSITY = 2
+
+    # number of samples per block of the cached extrema of v that bound the samples index_at compares
+    ENVELOPE_BLOCK = 1024
+
+
+    def plot(self, ax, decimate=None, yautoscale=False, **kwargs):
+        """
+        plot the series as a line
+        if t is increasing, only the part of the series inside the xlim of the axes is passed to matplotlib
+        :param ax: matplotlib axes
+        :param decimate: name of a decimation method (see decimation.METHODS) to reduce the series
+                         to the resolution of the axes; recomputed when the axes size or xlim changes
+        :param yautoscale: set the ylim from the visible part of the series when the xlim changes
+        """
+        from . import view
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        if decimate is None and not yautoscale and not self.axis_increasing(0):
+            return ax.plot(self.axes[0], self.axes[1], **kwargs)
+
+        # while the x axis is autoscaled the visible range follows from the data itself
+        xlim = None if ax.get_autoscalex_on() else ax.get_xlim()
+        lines = ax.plot(*self.visible(ax, xlim, decimate=decimate), **kwargs)
+        view.attach(ax, lines[0], partial(self._update_view, decimate=decimate, yautoscale=yautoscale), dataset=self)
+        return lines
+
+    def _update_view(self, ax, line, decimate=None, yautoscale=False):
+        """update the data of a line and optionally the ylim for the current view of the axes"""
+        xlim = ax.get_xlim()
+        line.set_data(*self.visible(ax, xlim, decimate=decimate))
+        if yautoscale:
+            ylim = self.visible_limits(xlim)[1]
+            if ylim is not None:
+                ax.set_ylim(ylim)
+
+    def index_at(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """
+        sample nearest to (x, y) within maxdist pixels; without maxdist y is not used
+        the samples within maxdist of x are found with a binary search on t; if there are more than ENVELOPE_BLOCK,
+        the series is at (x, y) if y is inside the envelope of their values and the sample nearest in t is returned
+        """
+        if not self.axis_increasing(0):
+            return None
+        t, v = self.axes[0], self.axes[1]
+        if np.isinf(maxdist):
+            i = _nearest_index(t, x, False, True)
+            return None if i is None else (i, i)
+
+        sx, sy = scale
+        start, stop = _index_range(t, (x - maxdist/sx, x + maxdist/sx), True, pad=0)
+        if stop - start > self.ENVELOPE_BLOCK:
+            vmin, vmax = self._envelope(start, stop)
+            if not vmin - maxdist/sy <= y <= vmax + maxdist/sy:
+                return None
+            i = _nearest_index(t, x, False, True)
+            return i, i
+
+        dist = np.hypot((t[start:stop] - x)*sx, (v[start:stop] - y)*sy)
+        if not (dist <= maxdist).any():
+            return None
+        i = start + int(np.nanargmin(dist))
+        return i, i
+
+    def _block_extrema(self):
+        """minimum and maximum of v in blocks of ENVELOPE_BLOCK samples; cached until the axes change"""
+        def compute():
+            n = self.ENVELOPE_BLOCK
+            v = self.axes[1]
+            blocks = v[:v.size // n * n].reshape(-1, n)
+            return np.fmin.reduce(blocks, axis=1), np.fmax.reduce(blocks, axis=1)
+        return self._cached('block_extrema', compute)
+
+    def _envelope(self, start, stop):
+        """minimum and maximum of v[start:stop] from the block extrema and the samples of the partial blocks"""
+        n = self.ENVELOPE_BLOCK
+        v = self.axes[1]
+        first, last = -(-start // n), stop // n
+        if first >= last:
+            return nanminmax(v[start:stop])
+        bmin, bmax = self._block_extrema()
+        edges = np.concatenate((v[start:first*n], v[last*n:stop]))
+        return nanminmax(np.concatenate((edges, bmin[first:last])))[0], \
+            nanminmax(np.concatenate((edges, bmax[first:last])))[1]
+
+    def visible_slice(self, xlim, pad=1):
+        """
+        find the part of the series inside xlim with a binary search on t
+        :param xlim: (xmin, xmax) or None for the entire series
+        :param pad: number of points outside xlim to include on each side, so a line continues to the edges
+        :return: slice of the series (the entire series if t is not increasing)
+        """
+        if xlim is None or not self.axis_increasing(0):
+            return slice(None)
+        return slice(*_index_range(self.axes[0], xlim, True, pad=pad))
+
+    def visible(self, ax, xlim, decimate=None):
+        """
+        select the part of the series inside xlim and decimate it to the pixel width of the axes
+        :return: (t, v) of the visible series
+        """
+        from . import view
+        s = self.visible_slice(xlim)
+        t, v = self.axes[0][s], self.axes[1][s]
+        if decimate is not None:
+            width, _ = view.pixel_size(ax)
+            t, v = decimation.decimate(t, v, width*self.DECIMATION_DENSITY, method=decimate)
+        return t, v
+
+    def visible_limits(self, xlim, **kwargs):
+        """
+        calculate the limits of the part of the series inside xlim
+        rounding is the same as for limits
+        :return: (np.array([xmin, xmax]), np.array([ymin, ymax]) or (None, None) if no data is visible
+        """
+        t, v = self.axes[0], self.axes[1]
+        if self.axis_increasing(0):
+            s = self.visible_slice(xlim, pad=0)
+            t, v = t[s], v[s]
+        else:
+            xmin, xmax = sorted(xlim)
+            inside = (t >= xmin) & (t <= xmax)
+            t, v = t[inside], v[inside]
+        if t.size == 0:
+            return None, None
+        (tmin, tmax), (vmin, vmax) = nanminmax(t), nanminmax(v)
+        return self._format_limits(tmin, tmax, vmin, vmax, **ChainMap(kwargs, self.LIMIT_SETTINGS))
 
     @classmethod
     def is_valid(cls, axes):
@@ -191,12 +562,157 @@ class Timeseries(Dataset):
 
     @classmethod
     def likelihood(cls, axes):
-        if cls.is_increasing(axes[0]):
+        if probe(axes).is_increasing(0):
             return .75
         return .25
 
 
-class Points(Dataset):
+class StreamingTimeseries(Timeseries):
+    """
+    timeseries that keeps the most recent samples in a ring buffer of fixed capacity
+    samples are added in batches with append; plotted lines are updated at the next draw of the canvas
+
+    every sample is written twice, at i and at i + capacity, so the samples in the buffer are always
+    available as a contiguous view without copying
+    the extrema of v are kept for blocks of the buffer, so an append only rescans the blocks it wrote to
+    """
+
+    LAYER_NAME = 'streamingtimeseries.plot'
+
+    # number of samples per block of which the extrema are kept
+    BLOCK_SIZE = 4096
+
+    def __init__(self, capacity, t=(), v=(), names=None):
+        """
+        :param capacity: maximum number of samples; older samples are dropped
+        :param t: initial times
+        :param v: initial values
+        """
+        self.capacity = int(capacity)
+        self._t = np.full(2*self.capacity, np.nan)
+        self._v = np.full(2*self.capacity, np.nan)
+        nblocks = -(-self.capacity // self.BLOCK_SIZE)
+        self._block_min = np.full(nblocks, np.nan)
+        self._block_max = np.full(nblocks, np.nan)
+        self._count = 0
+        super().__init__(t, v, names=names)
+
+    @property
+    def axes(self):
+        n = len(self)
+        start = (self._count - n) % self.capacity
+        return [self._t[start:start+n], self._v[start:start+n]]
+    @axes.setter
+    def axes(self, axes):
+        # replace all samples
+        self._t[:] = np.nan
+        self._v[:] = np.nan
+        self._block_min[:] = np.nan
+        self._block_max[:] = np.nan
+        self._count = 0
+        self.invalidate()
+        self.append(*axes)
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, t, v):
+        """
+        add a batch of samples
+        :param t: times; must be increasing and later than the last sample
+        :param v: values
+        """
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        v = np.atleast_1d(np.asarray(v, dtype=float))
+        if t.ndim != 1 or t.shape != v.shape:
+            raise InvalidAxes('t and v must be 1d arrays of the same size')
+        if t.size == 0:
+            return
+        if (t[1:] <= t[:-1]).any() or (len(self) and t[0] <= self.axes[0][-1]):
+            raise InvalidAxes('t must be increasing')
+
+        # samples that do not fit are overwritten anyway
+        if t.size > self.capacity:
+            self._count += t.size - self.capacity
+            t, v = t[-self.capacity:], v[-self.capacity:]
+
+        # write in at most two parts: up to the end of the buffer and from the start of the buffer
+        n = t.size
+        pos = self._count % self.capacity
+        first = min(n, self.capacity - pos)
+        blocks = set()
+        for src, dst in ((slice(0, first), pos), (slice(first, n), 0)):
+            size = src.stop - src.start
+            if size == 0:
+                continue
+            for buf, a in ((self._t, t), (self._v, v)):
+                buf[dst:dst+size] = a[src]
+                buf[dst+self.capacity:dst+self.capacity+size] = a[src]
+            blocks.update(range(dst // self.BLOCK_SIZE, (dst + size - 1) // self.BLOCK_SIZE + 1))
+        self._count += n
+
+        # update the extrema of the blocks that were written to
+        for b in blocks:
+            block = self._v[b*self.BLOCK_SIZE:min((b + 1)*self.BLOCK_SIZE, self.capacity)]
+            self._block_min[b] = np.fmin.reduce(block)
+            self._block_max[b] = np.fmax.reduce(block)
+
+        self.invalidate()
+
+    def extrema(self, i):
+        """
+        minimum and maximum of an axis from the first and last time and the block extrema of the values
+        :param i: index of the axis
+        :return: (vmin, vmax)
+        """
+        if not len(self):
+            return np.nan, np.nan
+        if i == 0:
+            t = self.axes[0]
+            return t[0], t[-1]
+        return np.fmin.reduce(self._block_min), np.fmax.reduce(self._block_max)
+
+    def axis_increasing(self, i):
+        # append only accepts increasing times
+        return i == 0 or super().axis_increasing(i)
+
+    def _update_view(self, ax, line, decimate=None, yautoscale=False):
+        # follow the incoming samples while the x axis is autoscaled
+        if ax.get_autoscalex_on() and len(self) > 1:
+            ax.set_xlim(self.extrema(0), auto=None)
+        super()._update_view(ax, line, decimate=decimate, yautoscale=yautoscale)
+
+    @classmethod
+    def is_valid(cls, axes):
+        # only created explicitly
+        return False
+
+
+class _PointLookup(object):
+    """
+    lookup of points by location for datasets with the x and y of the points as their first two axes
+    """
+
+    def spatial_index(self):
+        """spatial index of the points; built on first use and cached until the axes change"""
+        return self._cached('spatial_index', lambda: spatial.GridIndex(self.axes[0], self.axes[1]))
+
+    def nearest(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """
+        find the point nearest to a location (see spatial.GridIndex.nearest)
+        :return: (index, distance) or None
+        """
+        return self.spatial_index().nearest(x, y, scale=scale, maxdist=maxdist)
+
+    def index_at(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """nearest point within maxdist pixels"""
+        found = self.nearest(x, y, scale=scale, maxdist=maxdist)
+        if found is None:
+            return None
+        return (found[0],)*len(self.axes)
+
+
+class Points(_PointLookup, Dataset):
 
     DIMENSIONS = (1, 1)
     LIMIT_SETTINGS = dict(xunit='auto', yunit='auto')
@@ -204,8 +720,37 @@ class Points(Dataset):
     DEFAULT_NAMES = ('x', 'y')
     LAYER_NAME = 'points.scatter'
 
-    def plot(self, ax, **kwargs):
-        return ax.scatter(self.axes[0], self.axes[1], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+    # number of points above which points are aggregated into a raster by default
+    AGGREGATE_THRESHOLD = 10**6
+
+    def plot(self, ax, aggregate=None, **kwargs):
+        """
+        plot the points with a scatter plot or, with aggregate, as the density of points (see rasterize)
+        :param aggregate: aggregate the points into a raster with the resolution of the axes, updated on zoom
+                          by default used for datasets with more than AGGREGATE_THRESHOLD points
+        """
+        from matplotlib import colors
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        if aggregate is None:
+            aggregate = self.axes[0].size > self.AGGREGATE_THRESHOLD
+        if not aggregate:
+            return ax.scatter(self.axes[0], self.axes[1], **kwargs)
+
+        # the density is shown as the color with an opacity increasing with the (logarithm of the) count
+        r, g, b, a = colors.to_rgba(kwargs['color'], kwargs.get('alpha'))
+        cmap = colors.LinearSegmentedColormap.from_list('density', [(r, g, b, .2*a), (r, g, b, a)])
+        return _plot_raster(self, ax, 'count', dict(cmap=cmap, norm=colors.LogNorm()))
+
+    def rasterize(self, xlim, ylim, shape, statistic='count'):
+        """
+        number of points in each cell of a raster
+        :param xlim: (left, right) of the raster
+        :param ylim: (bottom, top) of the raster
+        :param shape: (rows, columns)
+        :param statistic: only 'count'; points have no values for other statistics
+        :return: 2d array; NaN for cells without points
+        """
+        return aggregation.rasterize(self.axes[0], self.axes[1], xlim, ylim, shape, statistic=statistic)
 
     @classmethod
     def is_valid(cls, axes):
@@ -218,17 +763,45 @@ class Points(Dataset):
         return True
 
 
-class ValuePoints(Dataset):
+class ValuePoints(_PointLookup, Dataset):
 
     DIMENSIONS = (1, 1, 1)
     LIMIT_SETTINGS = dict(xunit='auto', yunit='auto')
-    PLOT_DEFAULTS = dict(cmap=cm.inferno, lw=0, alpha=1., s=20)
+    PLOT_DEFAULTS = dict(cmap='inferno', lw=0, alpha=1., s=20)
     DEFAULT_NAMES = ('x', 'y', 'z')
     LAYER_NAME = 'valuepoints.scatter'
 
-    def plot(self, ax, valuetype='c', **kwargs):
-        kwargs[valuetype] = self.axes[2]
-        return ax.scatter(self.axes[0], self.axes[1], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+    # number of points above which points are aggregated into a raster by default
+    AGGREGATE_THRESHOLD = 10**6
+
+    def plot(self, ax, valuetype='c', aggregate=None, statistic='mean', **kwargs):
+        """
+        plot the points with a scatter plot or, with aggregate, as a raster of the values (see rasterize)
+        :param aggregate: aggregate the points into a raster with the resolution of the axes, updated on zoom
+                          by default used for datasets with more than AGGREGATE_THRESHOLD points
+        :param statistic: 'mean', 'min' or 'max' of the values of the points in a cell of the raster
+        """
+        if aggregate is None:
+            aggregate = self.axes[0].size > self.AGGREGATE_THRESHOLD
+        if not aggregate:
+            kwargs[valuetype] = self.axes[2]
+            return ax.scatter(self.axes[0], self.axes[1], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        return _plot_raster(self, ax, statistic, {k: kwargs[k] for k in ('cmap', 'norm', 'vmin', 'vmax', 'alpha')
+                                                  if k in kwargs})
+
+    def rasterize(self, xlim, ylim, shape, statistic='mean'):
+        """
+        aggregate the values of the points in each cell of a raster
+        :param xlim: (left, right) of the raster
+        :param ylim: (bottom, top) of the raster
+        :param shape: (rows, columns)
+        :param statistic: 'count', 'mean', 'min' or 'max'
+        :return: 2d array; NaN for cells without points
+        """
+        return aggregation.rasterize(self.axes[0], self.axes[1], xlim, ylim, shape,
+                                     values=self.axes[2], statistic=statistic)
 
     @classmethod
     def is_valid(cls, axes):
@@ -242,16 +815,195 @@ class ValuePoints(Dataset):
         return True
 
 
+def _imshow(ax, z, **kwargs):
+    """ax.imshow that keeps the aspect of the axes instead of setting the aspect of the image"""
+    aspect = ax.get_aspect()
+    im = ax.imshow(z, **kwargs)
+    ax.set_aspect(aspect)
+    return im
+
+
+def _plot_raster(dataset, ax, statistic, kwargs):
+    """
+    show a point dataset as an image of dataset.rasterize for the view of the axes, updated when the view changes
+    """
+    from . import view
+    (xmin, xmax), (ymin, ymax) = dataset.extrema(0), dataset.extrema(1)
+    ax.update_datalim([(xmin, ymin), (xmax, ymax)])
+    ax.autoscale_view()
+
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    width, height = view.pixel_size(ax)
+    z = dataset.rasterize(xlim, ylim, (height, width), statistic=statistic)
+    im = _imshow(ax, z, extent=xlim + ylim, origin='lower', interpolation='nearest', **kwargs)
+    view.attach(ax, im, partial(_update_raster, dataset, statistic=statistic), dataset=dataset)
+    return im
+
+
+def _update_raster(dataset, ax, im, statistic):
+    from . import view
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    width, height = view.pixel_size(ax)
+    im.set_data(dataset.rasterize(xlim, ylim, (height, width), statistic=statistic))
+    im.set_extent(xlim + ylim)
+    if statistic == 'count':
+        # counts depend on the zoom level; values keep the colors they had in the full view
+        im.autoscale()
+
+
+def _grid_index(dataset, x, y):
+    """indices of the cell at (x, y) for datasets with 1d x and y axes followed by 2d (y, x) axes"""
+    col = _nearest_index(dataset.axes[0], x, dataset.axis_equidistant(0), dataset.axis_increasing(0))
+    row = _nearest_index(dataset.axes[1], y, dataset.axis_equidistant(1), dataset.axis_increasing(1))
+    if col is None or row is None:
+        return None
+    return (col, row) + ((row, col),)*(len(dataset.axes) - 2)
+
+
 class Grid(Dataset):
 
     DIMENSIONS = (1, 1, 2)
     LIMIT_SETTINGS = dict()
-    PLOT_DEFAULTS = dict(cmap=cm.viridis)
+    PLOT_DEFAULTS = dict(cmap='viridis')
     DEFAULT_NAMES = ('x', 'y', 'z')
     LAYER_NAME = 'grid.pcolormesh'
 
-    def plot(self, ax, **kwargs):
-        return ax.pcolormesh(self.axes[0], self.axes[1], self.axes[2], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+    # number of cells above which a level of detail is drawn by default
+    LOD_THRESHOLD = 2**20
+
+    # maximum number of cells per pixel for a level of the pyramid to be drawn
+    LOD_DENSITY = 1
+
+    # ways to draw a grid; see plot
+    METHODS = ('imshow', 'nonuniform', 'pcolormesh')
+
+    def plot(self, ax, method=None, lod=None, reduce='mean', **kwargs):
+        """
+        plot the grid as an image or a mesh
+        :param ax: matplotlib axes
+        :param method: 'imshow' (equidistant axes), 'nonuniform' (increasing axes) or 'pcolormesh' (any axes)
+                       by default the fastest method that suits the axes (see plot_method)
+        :param lod: level of detail; draw the level of the pyramid (see level) that matches the pixel size
+                    of the axes, limited to the visible part of the grid and updated when the view changes
+                    by default used for grids larger than LOD_THRESHOLD
+        :param reduce: 'mean', 'min' or 'max'; how cells are combined in the levels of the pyramid
+        """
+        from . import view
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        if method is None:
+            method = self.plot_method()
+        elif method not in self.METHODS:
+            raise ValueError('unknown plot method {!r}'.format(method))
+        if lod is None:
+            lod = self.axes[2].size > self.LOD_THRESHOLD
+        if not lod:
+            return self._plot_grid(ax, method, self.axes[0], self.axes[1], self.axes[2], kwargs)
+
+        replacer = view.ArtistReplacer(
+            partial(self.select_level, reduce=reduce),
+            partial(self._plot_level, method=method, kwargs=dict(kwargs)),
+            dataset=self)
+
+        # only part of the grid may be drawn, autoscaling should use the entire grid;
+        # the view is updated first, so the first selection is made for the autoscaled view
+        (xmin, xmax), (ymin, ymax) = self.extrema(0), self.extrema(1)
+        ax.update_datalim([(xmin, ymin), (xmax, ymax)])
+        ax.autoscale_view()
+        return replacer.plot(ax)
+
+    def plot_method(self):
+        """
+        fastest method to draw the grid
+        imshow if both axes are equidistant, nonuniform if both are increasing, pcolormesh otherwise
+        """
+        if self.axis_equidistant(0) and self.axis_equidistant(1):
+            return 'imshow'
+        if self.axis_increasing(0) and self.axis_increasing(1):
+            return 'nonuniform'
+        return 'pcolormesh'
+
+    @staticmethod
+    def _plot_grid(ax, method, x, y, z, kwargs):
+        from matplotlib import image
+        if method == 'pcolormesh':
+            return ax.pcolormesh(x, y, z, **kwargs)
+
+        kwargs = dict(kwargs)
+        kwargs.setdefault('interpolation', 'nearest')
+        if method == 'imshow':
+            # an extent in decreasing order would invert the axes, so the image is flipped instead
+            if x.size > 1 and x[-1] < x[0]:
+                x, z = x[::-1], z[:, ::-1]
+            if y.size > 1 and y[-1] < y[0]:
+                y, z = y[::-1], z[::-1]
+            # the extent runs from the outer edges of the cells around the centers in x and y
+            dx = (x[-1] - x[0])/(x.size - 1) if x.size > 1 else 1
+            dy = (y[-1] - y[0])/(y.size - 1) if y.size > 1 else 1
+            extent = (x[0] - dx/2, x[-1] + dx/2, y[0] - dy/2, y[-1] + dy/2)
+            return _imshow(ax, z, extent=extent, origin='lower', **kwargs)
+
+        im = image.NonUniformImage(ax, **kwargs)
+        im.set_data(x, y, z)
+        ax.add_image(im)
+        ax.update_datalim([(x[0], y[0]), (x[-1], y[-1])])
+        ax.autoscale_view()
+        return im
+
+    def level(self, k, reduce='mean'):
+        """
+        get a level of the pyramid of the grid
+        level k combines blocks of 2**k by 2**k cells; it is computed from level k-1 on first use
+        :param k: level; 0 is the grid itself
+        :param reduce: 'mean', 'min' or 'max'; NaN values are ignored
+        :return: (x, y, z) of the level
+        """
+        if k == 0:
+            return tuple(self.axes)
+
+        return self._cached(('level', reduce, k), partial(self._compute_level, k, reduce))
+
+    def _compute_level(self, k, reduce):
+        x, y, z = self.level(k - 1, reduce=reduce)
+        nx, ny = x.size // 2, y.size // 2
+        return (
+            x[:2*nx].reshape(nx, 2).mean(axis=1),
+            y[:2*ny].reshape(ny, 2).mean(axis=1),
+            _reduce_blocks(z[:2*ny, :2*nx], reduce))
+
+    def max_level(self):
+        """highest level of the pyramid that has at least 2 cells in both directions"""
+        n = min(self.axes[0].size, self.axes[1].size)
+        return max(int(np.log2(n)) - 1, 0)
+
+    def select_level(self, ax, reduce='mean'):
+        """
+        select the level of the pyramid and the part of it that is visible in the axes
+        the level is the most detailed one with at most LOD_DENSITY cells per pixel
+        :return: (reduce, level, (ystart, ystop), (xstart, xstop), version)
+        """
+        from . import view
+        width, height = view.pixel_size(ax)
+        xrange = _index_range(self.axes[0], ax.get_xlim(), self.axis_increasing(0))
+        yrange = _index_range(self.axes[1], ax.get_ylim(), self.axis_increasing(1))
+        ncols, nrows = xrange[1] - xrange[0], yrange[1] - yrange[0]
+
+        k = 0
+        while k < self.max_level() and (ncols > width*self.LOD_DENSITY*2**k or nrows > height*self.LOD_DENSITY*2**k):
+            k += 1
+
+        f = 2**k
+        xrange = (xrange[0] // f, -(-xrange[1] // f))
+        yrange = (yrange[0] // f, -(-yrange[1] // f))
+        return reduce, k, yrange, xrange, self.version
+
+    def index_at(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """cell at (x, y) by arithmetic on equidistant axes or a binary search on increasing axes"""
+        return _grid_index(self, x, y)
+
+    def _plot_level(self, ax, selection, method, kwargs):
+        reduce, k, (y0, y1), (x0, x1), _ = selection
+        x, y, z = self.level(k, reduce=reduce)
+        return self._plot_grid(ax, method, x[x0:x1], y[y0:y1], z[y0:y1, x0:x1], kwargs)
 
     @classmethod
     def is_valid(cls, axes):
@@ -263,7 +1015,8 @@ class Grid(Dataset):
 
     @classmethod
     def likelihood(cls, axes):
-        if cls.is_equidistant(axes[0]) and cls.is_equidistant(axes[1]):
+        axes = probe(axes)
+        if axes.is_equidistant(0) and axes.is_equidistant(1):
             return .75
         else:
             return .25
@@ -273,12 +1026,58 @@ class IrregularGrid(Dataset):
 
     DIMENSIONS = (2, 2, 2)
     LIMIT_SETTINGS = dict(xunit='auto', yunit='auto')
-    PLOT_DEFAULTS = dict(cmap=cm.viridis)
+    PLOT_DEFAULTS = dict(cmap='viridis')
     DEFAULT_NAMES = ('x', 'y', 'z')
-    LAYER_NAME = 'irregulargrid.pcolor'
+    LAYER_NAME = 'irregulargrid.pcolormesh'
+
+    # ways to draw an irregular grid; see plot
+    METHODS = ('pcolormesh', 'tripcolor', 'tricontourf')
+
+    def plot(self, ax, method='pcolormesh', **kwargs):
+        """
+        plot the grid
+        :param ax: matplotlib axes
+        :param method: 'pcolormesh' (cells around the nodes), 'tripcolor' or 'tricontourf'
+                       the triangular methods use the triangulation of the grid (see triangulation)
+        """
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        if method == 'pcolormesh':
+            kwargs.setdefault('shading', 'nearest')
+            return ax.pcolormesh(self.axes[0], self.axes[1], self.axes[2], **kwargs)
+
+        tri = self.triangulation()
+        z = np.where(np.isfinite(self.axes[2]), self.axes[2], 0).ravel()
+        if method == 'tripcolor':
+            return ax.tripcolor(tri, z, **kwargs)
+        elif method == 'tricontourf':
+            return ax.tricontourf(tri, z, **kwargs)
+        raise ValueError('unknown plot method {!r}'.format(method))
+
+    def triangulation(self):
+        """
+        triangulation of the nodes of the grid, following its topology: each cell is split in two triangles
+        triangles with a node that has no valid coordinates or value are masked
+        cached until the axes change
+        :return: matplotlib.tri.Triangulation
+        """
+        return self._cached('triangulation', self._compute_triangulation)
+
+    def _compute_triangulation(self):
+        from matplotlib.tri import Triangulation
 
-    def plot(self, ax, **kwargs):
-        return ax.pcolor(self.axes[0], self.axes[1], self.axes[2], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+        x, y, z = self.axes
+        ny, nx = x.shape
+        # index of the lower left node of each cell, followed by its other nodes
+        ll = (np.arange(ny - 1)[:, None]*nx + np.arange(nx - 1)).ravel()
+        lr, ul, ur = ll + 1, ll + nx, ll + nx + 1
+        triangles = np.concatenate([np.column_stack([ll, lr, ur]), np.column_stack([ll, ur, ul])])
+
+        # invalid nodes are moved onto a valid node, so they do not affect the limits of the triangulation
+        valid = (np.isfinite(x) & np.isfinite(y) & np.isfinite(z)).ravel()
+        x, y = x.ravel(), y.ravel()
+        first = np.argmax(valid)
+        return Triangulation(np.where(valid, x, x[first]), np.where(valid, y, y[first]), triangles,
+                             mask=~valid[triangles].all(axis=1))
 
     @classmethod
     def is_valid(cls, axes):
@@ -298,8 +1097,88 @@ class VectorData(Dataset):
     DEFAULT_NAMES = ('x', 'y', 'U', 'V')
     LAYER_NAME = 'vectordata.quiver'
 
-    def plot(self, ax, **kwargs):
-        return ax.quiver(self.axes[0], self.axes[1], self.axes[2], self.axes[3], **ChainMap(kwargs, self.PLOT_DEFAULTS))
+    # default distance between arrows in pixels
+    SPACING = 20
+
+    def plot(self, ax, spacing=None, thinning='stride', **kwargs):
+        """
+        plot the vectors as arrows
+        the grid is thinned to about one arrow per spacing pixels in the visible part of the axes,
+        so the number of arrows is bounded by the size of the axes; the arrows are updated when the view changes
+        :param spacing: minimum distance between arrows in pixels (default: SPACING); 0 shows all arrows
+        :param thinning: 'stride' to draw every n-th vector or 'mean' to draw the mean vector of each block
+        """
+        from . import view
+        kwargs = ChainMap(kwargs, self.PLOT_DEFAULTS)
+        if spacing is None:
+            spacing = self.SPACING
+        if thinning not in ('stride', 'mean'):
+            raise ValueError('unknown thinning {!r}'.format(thinning))
+
+        replacer = view.ArtistReplacer(
+            partial(self.select_stride, spacing=spacing, thinning=thinning),
+            partial(self._plot_thinned, kwargs=dict(kwargs)),
+            dataset=self)
+
+        # only part of the grid may be drawn, autoscaling should use the entire grid;
+        # the view is updated first, so the first selection is made for the autoscaled view
+        (xmin, xmax), (ymin, ymax) = self.extrema(0), self.extrema(1)
+        ax.update_datalim([(xmin, ymin), (xmax, ymax)])
+        ax.autoscale_view()
+        return replacer.plot(ax)
+
+    def select_stride(self, ax, spacing, thinning='stride'):
+        """
+        select the stride and the visible part of the grid for the axes
+        the start of the visible part is a multiple of the stride, so the same vectors are kept while panning
+        :return: (thinning, (ystride, xstride), (ystart, ystop), (xstart, xstop), version)
+        """
+        from . import view
+        width, height = view.pixel_size(ax)
+        strides, ranges = [], []
+        for i, lim, pixels in ((1, ax.get_ylim(), height), (0, ax.get_xlim(), width)):
+            start, stop = _index_range(self.axes[i], lim, self.axis_increasing(i))
+            stride = max(int(np.ceil(spacing*(stop - start)/pixels)), 1)
+            strides.append(stride)
+            ranges.append((start - start % stride, stop))
+        return (thinning, tuple(strides)) + tuple(ranges) + (self.version,)
+
+    def thinned(self, strides, yrange=None, xrange=None, thinning='stride'):
+        """
+        get the vectors of part of the grid with a stride
+        :param strides: (ystride, xstride)
+        :param yrange: (start, stop) of the rows; default all
+        :param xrange: (start, stop) of the columns; default all
+        :param thinning: 'stride' for every n-th vector, 'mean' for the mean of each block of vectors
+        :return: (x, y, U, V)
+        """
+        (sy, sx), (y0, y1), (x0, x1) = strides, yrange or (0, None), xrange or (0, None)
+        x, y = self.axes[0][x0:x1], self.axes[1][y0:y1]
+        u, v = self.axes[2][y0:y1, x0:x1], self.axes[3][y0:y1, x0:x1]
+        if thinning == 'stride':
+            return x[::sx], y[::sy], u[::sy, ::sx], v[::sy, ::sx]
+
+        # blocks at the end of the range may be incomplete, these are padded with NaN
+        ny, nx = -(-u.shape[0] // sy), -(-u.shape[1] // sx)
+        means = []
+        for a, n, s in ((x, nx, sx), (y, ny, sy)):
+            means.append(np.nanmean(np.pad(a.astype(float), (0, n*s - a.size), constant_values=np.nan)
+                                    .reshape(n, s), axis=1))
+        for a in (u, v):
+            blocks = np.pad(a.astype(float), ((0, ny*sy - a.shape[0]), (0, nx*sx - a.shape[1])),
+                            constant_values=np.nan).reshape(ny, sy, nx, sx)
+            valid = ~np.isnan(blocks)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means.append(np.where(valid, blocks, 0).sum(axis=(1, 3))/valid.sum(axis=(1, 3)))
+        return tuple(means)
+
+    def index_at(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """vector at (x, y) by arithmetic on equidistant axes or a binary search on increasing axes"""
+        return _grid_index(self, x, y)
+
+    def _plot_thinned(self, ax, selection, kwargs):
+        thinning, strides, yrange, xrange, _ = selection
+        return ax.quiver(*self.thinned(strides, yrange, xrange, thinning=thinning), **kwargs)
 
     @classmethod
     def is_valid(cls, axes):
@@ -313,7 +1192,8 @@ class VectorData(Dataset):
 
     @classmethod
     def likelihood(cls, axes):
-        if cls.is_equidistant(axes[0]) and cls.is_equidistant(axes[1]):
+        axes = probe(axes)
+        if axes.is_equidistant(0) and axes.is_equidistant(1):
             return .75
         else:
             return .25
@@ -325,16 +1205,59 @@ for v in dict(locals()).values():
         DATATYPES.append(v)
 
 
-def interpret_datatype(*datavars, **kwargs):
+class ProbedAxes(list):
+    """
+    list of axes that remembers the results of scans over the data of its axes
+    used to scan each axis once while the likelihood of several dataset types is determined
+    """
+
+    def __init__(self, axes):
+        super().__init__(axes)
+        self._results = dict()
+
+    def _scan(self, name, i):
+        try:
+            return self._results[name, i]
+        except KeyError:
+            self._results[name, i] = result = getattr(Dataset, name)(self[i])
+            return result
+
+    def is_increasing(self, i):
+        return self._scan('is_increasing', i)
+
+    def is_equidistant(self, i):
+        return self._scan('is_equidistant', i)
+
+
+def probe(axes):
+    """wrap a list of axes as ProbedAxes unless it already is"""
+    if isinstance(axes, ProbedAxes):
+        return axes
+    return ProbedAxes(axes)
+
+
+def interpret_datatype(*datavars, mmap=False, **kwargs):
+    """
+    create a dataset of the most likely type for the given axes
+    :param datavars: arrays, array-likes or paths to .npy/.npz files (a .npz file adds all its arrays)
+    :param mmap: memory map arrays loaded from files instead of reading them into memory
+    :param kwargs: passed to the dataset
+    """
     axes = []
     for d in datavars:
+        if storage.is_path(d):
+            axes.extend(storage.load(d, mmap=mmap))
+            continue
         if not isinstance(d, np.ndarray):
-            d = np.array(d)
+            d = np.asarray(d)
         axes.append(d)
 
+    axes = ProbedAxes(axes)
+
+    # reject types by the number and dimensions of the axes before checking shapes and data
     options = []
     for d in DATATYPES:
-        if d.is_valid(axes):
+        if d.has_signature(axes) and d.is_valid(axes):
             options.append(d)
 
     options = sorted(options, key=lambda x: x.likelihood(axes))
@@ -0,0 +1,83 @@
+import numpy as np
+
+
+def lttb(x, y, n):
+    """
+    reduce a series to n points with the Largest-Triangle-Three-Buckets algorithm
+    the first and last point are kept, every bucket in between is represented by the point
+    that forms the largest triangle with the previously selected point and the average of the next bucket
+    :param x: 1d array of x values (sorted)
+    :param y: 1d array of y values
+    :param n: number of points to keep
+    :return: (x, y) of the selected points
+    """
+    size = x.size
+    if n >= size or n < 3:
+        return x, y
+
+    # bucket edges for the n-2 buckets between the first and the last point
+    edges = np.linspace(1, size - 1, n - 1).astype(int)
+
+    idx = np.empty(n, dtype=int)
+    idx[0] = 0
+    idx[-1] = size - 1
+
+    a = 0
+    for i in range(n - 2):
+        start, stop = edges[i], edges[i+1]
+
+        # the third point of the triangle is the average of the next bucket
+        if i < n - 3:
+            cx = x[stop:edges[i+2]].mean()
+            cy = y[stop:edges[i+2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - cx) * (y[start:stop] - ay) - (ax - x[start:stop]) * (cy - ay))
+        a = start + area.argmax()
+        idx[i+1] = a
+
+    return x[idx], y[idx]
+
+
+def minmax(x, y, n):
+    """
+    reduce a series to the minimum and maximum of n/2 buckets of equal size
+    both points are kept in their original order, so spikes remain visible
+    :param x: 1d array of x values (sorted)
+    :param y: 1d array of y values
+    :param n: number of points to keep
+    :return: (x, y) of the selected points
+    """
+    size = x.size
+    nbuckets = n // 2
+    if n >= size or nbuckets < 1:
+        return x, y
+
+    # equal sized buckets; the remainder is added to the last bucket
+    k = size // nbuckets
+    m = k * (nbuckets - 1)
+    buckets = y[:m].reshape(nbuckets - 1, k)
+    offsets = np.arange(0, m, k)
+    imin = np.append(buckets.argmin(axis=1) + offsets, m + y[m:].argmin())
+    imax = np.append(buckets.argmax(axis=1) + offsets, m + y[m:].argmax())
+
+    # keep min and max of each bucket in order of occurrence
+    idx = np.sort(np.column_stack([imin, imax]), axis=1).ravel()
+    return x[idx], y[idx]
+
+
+METHODS = dict(lttb=lttb, minmax=minmax)
+
+
+def decimate(x, y, n, method='minmax'):
+    """
+    reduce a series to approximately n points
+    :param method: name of the decimation method (see METHODS)
+    """
+    try:
+        func = METHODS[method]
+    except KeyError:
+        raise ValueError('unknown decimation method {!r}'.format(method))
+    return func(x, y, n)
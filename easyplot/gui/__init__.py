@@ -1,10 +1,9 @@
 from PyQt4 import QtGui, QtCore
 from . import settings
-from .figure import FigureCanvas
-from .. import datasets
+from .figure import Canvas, RedrawScheduler, BackgroundRenderer
+from .performance import PerformanceWidget
+from .. import datasets, view
 import matplotlib.figure
-import matplotlib.cm
-from matplotlib import pyplot as plt
 import numpy as np
 from ..managers import FigureManager
 from . import basewidgets as bw
@@ -20,12 +19,33 @@ class EasyPlotWindow(QtGui.QMainWindow):
 
 class EasyPlotWidget(QtGui.QWidget):
 
-    def __init__(self, *datasets, parent=None):
+    # maximum distance in pixels between the mouse and a point shown in the readout
+    HOVER_DISTANCE = 10
+
+    def __init__(self, *datasets, parent=None, redraw_delay=0, background_render=False):
+        """
+        :param datasets: datasets to choose from
+        :param redraw_delay: debounce time of redraws in ms (see RedrawScheduler)
+        :param background_render: render the figure on a worker thread while the gui stays responsive
+        """
         super().__init__(parent=parent)
 
         self.figure = matplotlib.figure.Figure(facecolor='none')
         self.figure_manager = FigureManager(self.figure)
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = Canvas(self.figure)
+
+        if background_render:
+            self.background_renderer = BackgroundRenderer(self.figure_manager, self.canvas, parent=self)
+            draw = self.background_renderer.submit
+        else:
+            self.background_renderer = None
+            draw = None
+
+        # all changes request a redraw from the scheduler, which combines them into a single draw
+        self.redraw = RedrawScheduler(self.canvas, delay=redraw_delay, draw=draw, parent=self)
+
+        # timers polling shared memory channels (see add_channel)
+        self.channel_timers = []
 
         self.layout = QtGui.QHBoxLayout(self)
 
@@ -36,11 +56,16 @@ class EasyPlotWidget(QtGui.QWidget):
         # plot buttons
         self.plot_button_layout = QtGui.QHBoxLayout()
         self.plot_button_layout.setContentsMargins(0, 0, 0, 0)
+        self.readout = QtGui.QLabel()
+        self.plot_button_layout.addWidget(self.readout, 1)
         self.plot_button = QtGui.QPushButton('plot')
         self.plot_button.clicked.connect(self.plot)
         self.plot_button_layout.addWidget(self.plot_button)
         self.figure_layout.addLayout(self.plot_button_layout)
 
+        # readout of the point under the mouse
+        self.canvas.mpl_connect('motion_notify_event', self.hover)
+
         # settings
         self.settings_toolbox = QtGui.QToolBox()
         self.settings_toolbox.setFixedWidth(300)
@@ -69,24 +94,80 @@ class EasyPlotWidget(QtGui.QWidget):
         self.plot_settings_widget = settings.ColorbarSettings()
         self.settings_toolbox.addItem(self.plot_settings_widget, 'Colorbar')
 
+        self.performance_widget = PerformanceWidget()
+        # all axes are plotted again, so the artists of all layers are timed
+        self.performance_widget.changed.connect(self.plot)
+        self.redraw.drawn.connect(self.refresh_performance)
+        self.settings_toolbox.addItem(self.performance_widget, 'Performance')
+
     def change_current_axes(self, i):
         old, new = i
         old.format(**self.ax_settings_widget.kwargs)
         self.ax_settings_widget.set_kwargs(reset=True, **new.settings)
-        self.canvas.draw()
+        self.redraw.request()
 
     def set_plotsettings(self, settings):
-        self.figure_manager.gca().layers.edit_current(**settings)
-        self.plot()
+        ax = self.figure_manager.gca()
+        ax.layers.edit_current(**settings)
+        self.redraw.request(ax)
 
     def set_axsettings(self, settings):
         self.figure_manager.gca().format(**settings)
-        self.canvas.draw()
+        self.redraw.request()
 
     def plot(self):
-        for a in self.figure_manager.axes:
-            a.plot()
-        self.canvas.draw()
+        self.redraw.request(*self.figure_manager.axes)
+
+    def refresh_performance(self):
+        if self.performance_widget.record_field.value():
+            self.performance_widget.refresh()
+
+    def hover(self, event):
+        """
+        show the values of the top layer with data under the mouse (see Dataset.readout)
+        or the coordinates of the mouse if there is none
+        """
+        if event.inaxes is None:
+            self.readout.setText('')
+            return
+        try:
+            axman = self.figure_manager.axes[self.figure_manager.ax2index(event.inaxes)]
+        except ValueError:
+            return
+
+        text = 'x={:.6g}, y={:.6g}'.format(event.xdata, event.ydata)
+        scale = view.pixel_scale(event.inaxes)
+        # the top layer is checked first
+        for l in reversed(axman.layers):
+            values = l['data'].readout(event.xdata, event.ydata, scale=scale, maxdist=self.HOVER_DISTANCE)
+            if values is not None:
+                text = ', '.join('{}={:.6g}'.format(n, v) for n, v in values)
+                break
+        self.readout.setText(text)
+
+    def add_channel(self, reader, interval=33):
+        """
+        add the dataset of a shared memory channel to the current axes and redraw when new data is published
+        the dataset is added with the first publication, the arrays hold no data before
+        :param reader: channel.ChannelReader
+        :param interval: polling interval in ms
+        """
+        timer = QtCore.QTimer(self)
+        timer.timeout.connect(partial(self.poll_channel, reader))
+        timer.start(interval)
+        self.channel_timers.append(timer)
+
+    def poll_channel(self, reader):
+        first = reader.received == 0
+        if not reader.poll():
+            return
+        d = reader.dataset()
+        if first:
+            self.add_datasets([d])
+            return
+        changed = [a for a in self.figure_manager.axes if a.layers.data_changed(d)]
+        if changed:
+            self.redraw.request(*changed)
 
     def add_datasets(self, datasets):
         for d in datasets:
@@ -97,7 +178,7 @@ class EasyPlotWidget(QtGui.QWidget):
             ax.check_limits(xlim=xlim, ylim=ylim)
             self.plot_stack.for_dataset(d)
             self.settings_toolbox.setCurrentWidget(self.plot_stack)
-        self.plot()
+        self.redraw.request(self.figure_manager.gca())
 
 
 class DatasetSelectorWidget(QtGui.QWidget):
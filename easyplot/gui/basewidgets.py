@@ -2,7 +2,8 @@ from PyQt4 import QtGui, QtCore
 from collections import OrderedDict
 import numpy as np
 import re
-from matplotlib import colors, cm
+from matplotlib import colors
+from . import colormaps
 
 
 class InvalidColorError(Exception): pass
@@ -376,6 +377,10 @@ class Color(SettingWidget):
         self.textfield.setText(self.format_color(rgb))
         self.changed()
 
+    def set_value(self, v):
+        self.color = v
+        self.textfield.setText(self.format_color(self.color))
+
     def value(self):
         s = str(self.textfield.text())
         if s == '':
@@ -386,20 +391,59 @@ class Color(SettingWidget):
 
 
 class Colormap(Dropdown):
-
-    def __init__(self, default, parent=None):
-        opts = OrderedDict(self.list_colormaps())
-        if isinstance(default, str):
-            default_cmap = cm.get_cmap(default)
-        elif isinstance(default, colors.Colormap):
-            default, default_cmap = default.name, default
-        opts[default] = default_cmap
-        default_index = list(opts.keys()).index(default)
+    """
+    dropdown with the names and previews of the registered colormaps
+    the names and icons come from the colormap catalogue, so they are listed and rendered once per process
+    """
+
+    def __init__(self, default=None, parent=None):
+        """
+        :param default: name or instance of the selected colormap; None selects the default item
+        """
+        self.catalogue = colormaps.catalogue()
+        opts = self.catalogue.options
+        if isinstance(default, colors.Colormap):
+            default = default.name
+        if default is None:
+            default_index = 0
+        else:
+            if default not in opts:
+                # copy, the options of the catalogue are shared
+                opts = OrderedDict(opts)
+                opts[default] = default
+            # the first item of the dropdown is 'default'
+            default_index = list(opts.keys()).index(default) + 1
         super().__init__(opts, default_index=default_index, parent=parent)
 
-    @classmethod
-    def list_colormaps(cls):
-        return [(name, c) for name, c in cm.__dict__.items() if isinstance(c, colors.Colormap)]
+    def build(self):
+        super().build()
+        # names of the items still waiting for an icon; only registered colormaps get one
+        self.missing = set()
+        for i, name in enumerate(self.opts.keys()):
+            icon = self.catalogue.icon(name)
+            if icon is None:
+                if name in self.catalogue.options:
+                    self.missing.add(name)
+            else:
+                self.dd.setItemIcon(i + 1, icon)
+        if self.missing:
+            self.catalogue.icon_ready.connect(self.set_icon)
+            self.catalogue.request_icons(sorted(self.missing))
+
+    def set_icon(self, name):
+        if name not in self.missing:
+            return
+        self.missing.discard(name)
+        self.dd.setItemIcon(list(self.opts.keys()).index(name) + 1, self.catalogue.icon(name))
+        if not self.missing:
+            self.catalogue.icon_ready.disconnect(self.set_icon)
+
+    @staticmethod
+    def list_colormaps():
+        """
+        list of (name, name) of the registered colormaps; matplotlib accepts the names as cmap
+        """
+        return list(colormaps.catalogue().options.items())
 
 
 class Checkbox(SettingWidget):
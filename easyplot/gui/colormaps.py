@@ -0,0 +1,78 @@
+from PyQt4 import QtGui, QtCore
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+from .. import rendering
+
+
+class ColormapCatalogue(QtCore.QObject):
+    """
+    names and preview icons of the registered colormaps, shared by all colormap fields of the process
+    the gradients of the icons are rendered on a worker thread when they are first requested
+    """
+
+    # emitted on the gui thread with the name of a colormap when its icon is available
+    icon_ready = QtCore.pyqtSignal(str)
+
+    _rendered = QtCore.pyqtSignal(str, object)
+
+    ICON_SIZE = (64, 12)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        names = sorted(matplotlib.colormaps)
+        # options for dropdowns; shared, so not to be modified
+        self.options = OrderedDict((n, n) for n in names)
+        self.icons = dict()
+        self._pending = set()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._rendered.connect(self._add_icon)
+
+    def names(self):
+        return list(self.options)
+
+    def icon(self, name):
+        """
+        preview icon of a colormap
+        :return: QIcon or None if it is not rendered yet; request it with request_icons
+        """
+        return self.icons.get(name)
+
+    def request_icons(self, names):
+        """render the icons of the colormaps that are not rendered or requested yet"""
+        missing = [n for n in names if n not in self.icons and n not in self._pending]
+        if missing:
+            self._pending.update(missing)
+            self.executor.submit(self._render, missing)
+
+    def _render(self, names):
+        width, height = self.ICON_SIZE
+        for n in names:
+            try:
+                gradient = rendering.colormap_gradient(n, width, height)
+            except (KeyError, ValueError):
+                # not a registered colormap
+                gradient = None
+            self._rendered.emit(n, gradient)
+
+    def _add_icon(self, name, gradient):
+        self._pending.discard(name)
+        if gradient is None:
+            return
+        height, width = gradient.shape[:2]
+        argb = rendering.rgba_to_argb32(gradient)
+        # the pixmap copies the pixels, the image only uses them while it is converted
+        image = QtGui.QImage(argb.tobytes(), width, height, QtGui.QImage.Format_ARGB32)
+        self.icons[name] = QtGui.QIcon(QtGui.QPixmap.fromImage(image))
+        self.icon_ready.emit(name)
+
+
+_catalogue = None
+
+
+def catalogue():
+    """the colormap catalogue of the process; created on first use (after the QApplication)"""
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = ColormapCatalogue()
+    return _catalogue
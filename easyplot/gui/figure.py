@@ -1,7 +1,183 @@
+from PyQt4 import QtGui, QtCore
 from matplotlib.backends.backend_qt4agg import FigureCanvas
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from .. import profiling, rendering
 
 
 class Canvas(FigureCanvas):
+    """
+    canvas that can show a frame rendered elsewhere (front buffer) instead of drawing the figure itself
+    while a BackgroundRenderer is attached, idle draws (e.g. after a resize) are rendered by it instead
+    """
 
     def __init__(self, fig):
-        super().__init__(fig)
\ No newline at end of file
+        super().__init__(fig)
+        self.front_buffer = None
+        self._front_data = None
+        # set by BackgroundRenderer
+        self.background_renderer = None
+
+    def set_front_buffer(self, argb, width, height):
+        """
+        show a rendered frame
+        :param argb: contiguous uint8 array with pixels in QImage.Format_ARGB32 byte order
+        """
+        # the image does not copy the data, so it is kept alive with the image
+        self._front_data = argb.tobytes()
+        self.front_buffer = QtGui.QImage(self._front_data, width, height, QtGui.QImage.Format_ARGB32)
+        self.update()
+
+    def draw(self):
+        with profiling.timed('canvas.draw'):
+            super().draw()
+
+    def draw_idle(self):
+        if self.background_renderer is not None:
+            self.background_renderer.submit()
+        else:
+            super().draw_idle()
+
+    def paintEvent(self, e):
+        if self.front_buffer is None:
+            return super().paintEvent(e)
+        painter = QtGui.QPainter(self)
+        painter.drawImage(0, 0, self.front_buffer)
+        painter.end()
+
+
+class BackgroundRenderer(QtCore.QObject):
+    """
+    renders snapshots of a figure with Agg on a worker thread and shows the result on a Canvas
+    the canvas keeps showing the previous frame until a new one is ready
+    a render that is superseded by a newer request is skipped, or discarded if it was already running
+    """
+
+    rendered = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, figure_manager, canvas, parent=None):
+        super().__init__(parent)
+        self.figure_manager = figure_manager
+        self.canvas = canvas
+        self.generation = 0
+        self.frames = 0
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.rendered.connect(self.swap)
+        # idle draws of the canvas, such as the one after a resize, are rendered in the background
+        self.canvas.background_renderer = self
+
+        # set when the render of the latest request is superseded
+        self._cancel = threading.Event()
+        # number of renders that were skipped or discarded; counted on both threads
+        self._cancelled = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        with self._lock:
+            return self._cancelled
+
+    def _count_cancelled(self):
+        with self._lock:
+            self._cancelled += 1
+
+    def submit(self):
+        """render the current state of the figure"""
+        self.generation += 1
+        self._cancel.set()
+        self._cancel = cancel = threading.Event()
+        # the snapshot is taken on the gui thread, the worker only touches the copy
+        # copying is part of the latency of every frame, so it is timed separately from the render
+        with profiling.timed('canvas.snapshot'):
+            fig = self.figure_manager.snapshot()
+        self.executor.submit(self._render, self.generation, fig, cancel)
+
+    def _render(self, generation, fig, cancel):
+        if cancel.is_set():
+            self._count_cancelled()
+            return
+        with profiling.timed('canvas.render'):
+            rgba = rendering.render_rgba(fig)
+        if cancel.is_set():
+            self._count_cancelled()
+            return
+        self.rendered.emit(generation, rendering.rgba_to_argb32(rgba))
+
+    def swap(self, generation, argb):
+        if generation != self.generation:
+            self._count_cancelled()
+            return
+        height, width = argb.shape[:2]
+        self.canvas.set_front_buffer(argb, width, height)
+        self.frames += 1
+
+    def shutdown(self):
+        if self.canvas.background_renderer is self:
+            self.canvas.background_renderer = None
+        self.generation += 1
+        self._cancel.set()
+        self.executor.shutdown(wait=False)
+
+
+class RedrawScheduler(QtCore.QObject):
+    """
+    collects redraw requests and handles a burst of them with a single idle draw of the canvas
+    axes marked dirty by a request are plotted again before the draw
+    """
+
+    drawn = QtCore.pyqtSignal()
+
+    def __init__(self, canvas, delay=0, draw=None, parent=None):
+        """
+        :param canvas: matplotlib canvas to draw
+        :param delay: debounce time in ms; every request postpones the draw until no request came in for this time
+                      with 0 all requests within one event-loop iteration are combined
+        :param draw: function that draws; defaults to canvas.draw_idle
+        """
+        super().__init__(parent)
+        self.canvas = canvas
+        self.draw = draw or canvas.draw_idle
+        self.dirty = []
+        self.requests = 0
+        self.draws = 0
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        self.delay = delay
+
+    @property
+    def delay(self):
+        return self.timer.interval()
+    @delay.setter
+    def delay(self, ms):
+        self.timer.setInterval(int(ms))
+
+    @property
+    def suppressed(self):
+        """number of requests that were combined with another request instead of causing a draw"""
+        return self.requests - self.draws
+
+    def request(self, *axes):
+        """
+        schedule a draw of the canvas
+        :param axes: AxesManager instances to plot again before drawing
+        """
+        self.requests += 1
+        for a in axes:
+            if not any(a is d for d in self.dirty):
+                self.dirty.append(a)
+        self.timer.start()
+
+    def flush(self):
+        """plot the dirty axes and draw the canvas now"""
+        self.timer.stop()
+        dirty, self.dirty = self.dirty, []
+        # axes removed from the figure since the request (see FigureManager.set_ax_count) are not plotted
+        axes = self.canvas.figure.axes
+        for a in dirty:
+            if any(a.ax is ax for ax in axes):
+                a.plot()
+        self.draw()
+        self.draws += 1
+        self.drawn.emit()
@@ -0,0 +1,81 @@
+from PyQt4 import QtGui, QtCore
+from . import basewidgets as bw
+from .. import profiling
+
+
+class PerformanceWidget(QtGui.QWidget):
+    """
+    timings of the layers and the hot paths recorded by profiling
+    layers are sorted by their total draw time, with their share of the draw time of all layers
+    """
+
+    # emitted when recording is switched on or off
+    changed = QtCore.pyqtSignal(bool)
+
+    COLUMNS = ('name', 'count', 'total ms', 'p50 ms', 'p95 ms', 'share')
+
+    def __init__(self, parent=None, interval=1000):
+        """
+        :param interval: refresh interval in ms while recording
+        """
+        super().__init__(parent=parent)
+        self.build()
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.refresh)
+
+    def build(self):
+        self.layout = QtGui.QVBoxLayout(self)
+        self.layout.setContentsMargins(10, 0, 0, 0)
+
+        form = QtGui.QFormLayout()
+        self.record_field = bw.Checkbox(profiling.registry.enabled)
+        self.record_field.value_changed.connect(self.set_recording)
+        form.addRow('record timings', self.record_field)
+        self.layout.addLayout(form)
+
+        self.tree = QtGui.QTreeWidget()
+        self.tree.setColumnCount(len(self.COLUMNS))
+        self.tree.setHeaderLabels(list(self.COLUMNS))
+        self.tree.setColumnWidth(0, 140)
+        self.layout.addWidget(self.tree)
+
+        self.reset_button = QtGui.QPushButton('reset')
+        self.reset_button.clicked.connect(self.reset)
+        self.layout.addWidget(self.reset_button)
+
+    def set_recording(self, b):
+        if b:
+            profiling.enable()
+            self.timer.start()
+        else:
+            profiling.disable()
+            self.timer.stop()
+        self.changed.emit(b)
+
+    def reset(self):
+        profiling.registry.reset()
+        self.refresh()
+
+    def refresh(self):
+        summary = profiling.registry.summary()
+        layers = [(k[len(profiling.LAYER_PREFIX):], v) for k, v in summary.items()
+                  if k.startswith(profiling.LAYER_PREFIX)]
+        operations = [(k, v) for k, v in summary.items() if not k.startswith(profiling.LAYER_PREFIX)]
+        layer_total = sum(v['total'] for _, v in layers)
+
+        self.tree.clear()
+        for title, items, total in (('layers', layers, layer_total), ('operations', operations, None)):
+            parent = QtGui.QTreeWidgetItem([title])
+            self.tree.addTopLevelItem(parent)
+            for name, v in sorted(items, key=lambda i: i[1]['total'], reverse=True):
+                share = '{:.0f}%'.format(100*v['total']/total) if total else ''
+                parent.addChild(QtGui.QTreeWidgetItem([
+                    name,
+                    str(v['count']),
+                    '{:.1f}'.format(1e3*v['total']),
+                    '{:.2f}'.format(1e3*v['p50']),
+                    '{:.2f}'.format(1e3*v['p95']),
+                    share]))
+            parent.setExpanded(True)
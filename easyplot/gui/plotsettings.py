@@ -1,7 +1,7 @@
 from PyQt4 import QtGui, QtCore
 from .settings import PlotSettings
 from . import basewidgets as bw
-from .. import datasets
+from .. import datasets, decimation
 
 
 
@@ -21,6 +21,14 @@ def _linestyle_field(**kwargs):
     return bw.Dropdown(['-', '--', '-.', ':'], **kwargs)
 
 
+def _decimate_field(**kwargs):
+    return bw.Dropdown(list(decimation.METHODS), **kwargs)
+
+
+def _switch_field(**kwargs):
+    return bw.Dropdown([('on', True), ('off', False)], **kwargs)
+
+
 def _linewidth_field(*args, **kwargs):
     return bw.Float(*args, **kwargs)
 
@@ -75,6 +83,14 @@ class TimeseriesPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('marker', f)
 
+        self.fields['decimate'] = f = _decimate_field()
+        f.value_changed.connect(self.change)
+        self.layout.addRow('decimate', f)
+
+        self.fields['yautoscale'] = f = bw.Checkbox(False)
+        f.value_changed.connect(self.change)
+        self.layout.addRow('autoscale y', f)
+
 
 class PointsPlotSettings(PlotSettings):
 
@@ -94,6 +110,9 @@ class PointsPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('alpha', f)
 
+        self.fields['aggregate'] = f = _switch_field()
+        f.value_changed.connect(self.change)
+        self.layout.addRow('aggregate', f)
 
 
 class ValuePointsPlotSettings(PlotSettings):
@@ -114,6 +133,14 @@ class ValuePointsPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('alpha', f)
 
+        self.fields['aggregate'] = f = _switch_field()
+        f.value_changed.connect(self.change)
+        self.layout.addRow('aggregate', f)
+
+        self.fields['statistic'] = f = bw.Dropdown(['mean', 'min', 'max'])
+        f.value_changed.connect(self.change)
+        self.layout.addRow('statistic', f)
+
 
 class GridPlotSettings(PlotSettings):
 
@@ -125,6 +152,23 @@ class GridPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('colormap', f)
 
+        self.fields['method'] = f = bw.Dropdown(list(datasets.Grid.METHODS))
+        f.value_changed.connect(self.change)
+        self.layout.addRow('draw as', f)
+        self.default_method = QtGui.QLabel()
+        self.layout.addRow('', self.default_method)
+
+        self.fields['lod'] = f = _switch_field()
+        f.value_changed.connect(self.change)
+        self.layout.addRow('level of detail', f)
+
+        self.fields['reduce'] = f = bw.Dropdown(['mean', 'min', 'max'])
+        f.value_changed.connect(self.change)
+        self.layout.addRow('reduce', f)
+
+    def show_dataset(self, d):
+        self.default_method.setText('default: {}'.format(d.plot_method()))
+
 
 class IrregularGridPlotSettings(PlotSettings):
 
@@ -136,6 +180,10 @@ class IrregularGridPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('colormap', f)
 
+        self.fields['method'] = f = bw.Dropdown(list(datasets.IrregularGrid.METHODS))
+        f.value_changed.connect(self.change)
+        self.layout.addRow('draw as', f)
+
 
 class VectorDataPlotSettings(PlotSettings):
 
@@ -151,8 +199,22 @@ class VectorDataPlotSettings(PlotSettings):
         f.value_changed.connect(self.change)
         self.layout.addRow('color', f)
 
+        self.fields['spacing'] = f = bw.Float()
+        f.value_changed.connect(self.change)
+        self.layout.addRow('spacing (px)', f)
+
+        self.fields['thinning'] = f = bw.Dropdown(['stride', 'mean'])
+        f.value_changed.connect(self.change)
+        self.layout.addRow('thinning', f)
+
 
 def get_by_dataset(d):
     if not isinstance(d, datasets.Dataset):
         raise TypeError('argument must be a dataset')
-    return globals()[d.__class__.__name__+'PlotSettings']
\ No newline at end of file
+    # subclasses of datasets without settings of their own use the settings of their base class
+    for cls in type(d).__mro__:
+        try:
+            return globals()[cls.__name__+'PlotSettings']
+        except KeyError:
+            pass
+    raise KeyError('no plot settings for {}'.format(type(d).__name__))
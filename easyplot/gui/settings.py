@@ -2,7 +2,7 @@ from PyQt4 import QtGui, QtCore
 from . import basewidgets as bw
 from .utils import clear_layout
 from functools import partial
-from matplotlib import pyplot as plt
+import matplotlib.style
 from collections import OrderedDict, ChainMap
 import numpy as np
 
@@ -42,7 +42,8 @@ class FigureSettings(SettingsWidget):
         self.layout.addRow(self.ax_pos_layout)
         self.fill_ax_positions()
 
-        self.style_dd = bw.Dropdown(plt.style.available, default_index=plt.style.available.index('ggplot'))
+        styles = matplotlib.style.available
+        self.style_dd = bw.Dropdown(styles, default_index=styles.index('ggplot'))
         self.style_dd.value_changed.connect(self.set_style)
         self.layout.addRow('style', self.style_dd)
 
@@ -106,7 +107,7 @@ class FigureSettings(SettingsWidget):
             QtGui.QMessageBox.warning(self, 'invalid number of rows', 'number of rows larger than 10 not allowed')
             return
 
-        self.figure_manager.set_axrow_count(v)
+        self.figure_manager.set_axrow_count(v, reset=False)
         self.reload_ax_positions()
         self.changed.emit()
 
@@ -170,6 +171,7 @@ class AxesSettings(SettingsWidget):
 
     @property
     def ax(self):
+        from matplotlib import pyplot as plt
         return plt.gca()
 
 
@@ -202,6 +204,7 @@ class PlotStack(SettingsWidget):
             self.widgets[name] = w = get_by_dataset(d)()
             w.changed.connect(self.changed.emit)
             self.stack.addWidget(w)
+        self.widgets[name].show_dataset(d)
         self.stack.setCurrentWidget(self.widgets[name])
 
     @property
@@ -220,6 +223,10 @@ class PlotSettings(SettingsWidget):
         self.layout = QtGui.QFormLayout(self)
         self.fields = OrderedDict()
 
+    def show_dataset(self, d):
+        """update information about the dataset of the current layer"""
+        pass
+
     def change(self, *args):
         data = dict()
         for k, field in self.fields.items():
@@ -1,8 +1,8 @@
-from matplotlib import pyplot as plt, axes
 import numpy as np
 from math import ceil
+import copy
 from collections import ChainMap
-from . import datasets
+from . import datasets, profiling
 
 
 class FigureManager(object):
@@ -36,19 +36,31 @@ class FigureManager(object):
         return self._axrow_count
 
     def set_ax_count(self, val, reset=True):
-        if not reset:
-            data = [(a.layers, a.settings) for a in self.axes]
-            data += [(None, dict())]*(val - len(self.axes))
-        else:
-            data = [(None, dict())]*val
+        """
+        set the number of axes and arrange them in a grid with axrow_count rows
+        existing axes are moved in place and keep their layers, settings and artists; only missing axes are created
+        :param val: number of axes
+        :param reset: remove all axes and create new ones without layers and settings
+        """
+        from matplotlib.gridspec import GridSpec
+        if reset:
+            self.fig.clear()
+            self.axes = []
 
-        self.axes = []
-        self.fig.clear()
+        for a in self.axes[val:]:
+            self.fig.delaxes(a.ax)
+        del self.axes[val:]
+
+        rows = self.axrow_count()
+        grid = GridSpec(rows, ceil(val/rows), figure=self.fig)
         for i in range(val):
-            ax = self.fig.add_subplot(self.axrow_count(), ceil(val/self.axrow_count()), i+1)
-            layers, settings = data[i]
-            axman = AxesManager(ax, layers=layers, **settings)
-            self.axes.append(axman)
+            spec = grid[i]
+            if i < len(self.axes):
+                ax = self.axes[i].ax
+                ax.set_subplotspec(spec)
+                ax.set_position(spec.get_position(self.fig))
+            else:
+                self.axes.append(AxesManager(self.fig.add_subplot(spec)))
 
     def set_axrow_count(self, i, reset=True):
         self._axrow_count = i
@@ -79,27 +91,75 @@ class FigureManager(object):
     def set_style(self, s):
         """
         apply style and recreate axes
-        :param s: style name from plt.style.available
+        :param s: style name from matplotlib.style.available
         """
+        import matplotlib.style
         old_data = [(a.position, a.layers, a.settings) for a in self.axes]
         print(old_data)
+        matplotlib.style.use(s)
+        self.create_axes(old_data)
+
+    def create_axes(self, data):
+        """
+        clear the figure and create new axes
+        :param data: list of (position, layers, settings) for each axes
+        """
         self.fig.clear()
         self.axes = []
-        plt.style.use(s)
-        for p, l, s in old_data:
+        for p, l, s in data:
             self.axes.append(AxesManager(self.fig.add_axes(p), layers=l, **s))
 
     def draw(self):
         self.fig.canvas.draw()
 
+    def snapshot(self):
+        """
+        copy the figure with all its axes and artists, e.g. to render it on another thread
+        the datasets (with their arrays and caches) and the data of the artists are shared with the copy
+        instead of copied, so the cost does not grow with the size of the data;
+        artists replace their data when it changes instead of changing it in place, so the copy keeps a consistent state
+        :return: matplotlib.figure.Figure without a (gui) canvas
+        """
+        memo = dict()
+        for a in self.axes:
+            for l in a.layers:
+                d = l['data']
+                memo[id(d)] = d
+                for arr in d.axes:
+                    memo[id(arr)] = arr
+            for artist in a.ax.get_children():
+                for arr in _artist_data(artist):
+                    memo[id(arr)] = arr
+        return copy.deepcopy(self.fig, memo)
+
     def gca(self):
         return self.axes[self.current_index]
 
 
+def _artist_data(artist):
+    """arrays held by an artist directly, in its paths or in its cached transformed paths"""
+    from matplotlib.path import Path
+    from matplotlib.transforms import TransformedPath
+    values = list(vars(artist).values())
+    while values:
+        v = values.pop()
+        if isinstance(v, np.ndarray):
+            yield v
+        elif isinstance(v, Path):
+            yield v.vertices
+            if v.codes is not None:
+                yield v.codes
+        elif isinstance(v, TransformedPath):
+            values.extend(vars(v).values())
+        elif isinstance(v, list) and v and isinstance(v[0], Path):
+            values.extend(v)
+
+
 class AxesManager(object):
 
     def __init__(self, ax, layers=None, **settings):
-        if not isinstance(ax, axes.Axes):
+        from matplotlib.axes import Axes
+        if not isinstance(ax, Axes):
             raise TypeError('first argument not an instance of matplotlib.axes.Axes')
         self.ax = ax
 
@@ -142,30 +202,49 @@ class AxesManager(object):
             self.settings[name] = np.array([min(vmin_old, vmin), max(vmax_old, vmax)])
 
     def apply_settings(self):
-        for k, v in self.settings.items():
-            try:
-                setter = getattr(self.ax, 'set_{}'.format(k))
-            except AttributeError:
-                raise AttributeError('{} not a valid axes setting'.format(k))
-            else:
-                setter(v)
-
-    def plot(self):
-        self.ax.clear()
-        self.apply_settings()
-        self.ax.hold(True)
-        self.ax.set_prop_cycle(None)
-        self.layers.plot(self.ax)
-        self.ax.hold(False)
+        with profiling.timed('AxesManager.apply_settings'):
+            for k, v in self.settings.items():
+                try:
+                    setter = getattr(self.ax, 'set_{}'.format(k))
+                except AttributeError:
+                    raise AttributeError('{} not a valid axes setting'.format(k))
+                else:
+                    setter(v)
+
+    def plot(self, reset=False):
+        """
+        plot all layers
+        layers that were plotted before are updated in place (see LayersContainer.plot)
+        :param reset: clear the axes and plot all layers again
+        """
+        with profiling.timed('AxesManager.plot'):
+            if reset:
+                self.ax.clear()
+                self.layers.forget_artists()
+                self.ax.set_prop_cycle(None)
+            self.apply_settings()
+            self.layers.plot(self.ax, name=self.label())
+
+    def label(self):
+        """position of the axes as text"""
+        return '[{:.2f}, {:.2f}, {:.2f}, {:.2f}]'.format(*self.position)
 
     def __str__(self):
-        return '<{}.{} [{:.2f}, {:.2f}, {:.2f}, {:.2f}]>'.format(__name__, self.__class__.__name__, *self.position)
+        return '<{}.{} {}>'.format(__name__, self.__class__.__name__, self.label())
 
 
 class LayersContainer(list):
 
     def __init__(self, *layers):
         super().__init__()
+
+        # artists of plotted layers by id of the layer as (layer, ax, artists)
+        self._artists = dict()
+        # kwargs changed since a layer was plotted by id of the layer; None if the layer must be plotted again
+        self._changes = dict()
+        # colors of layers taken from the property cycle of the axes by id of the layer (see _plot_layer)
+        self._colors = dict()
+
         for l in layers:
             if isinstance(l, dict):
                 self.add(l['data'], **l['kwargs'])
@@ -207,13 +286,18 @@ class LayersContainer(list):
         self.current_index = len(self) - 1
 
     def edit(self, i, **kwargs):
+        changed = self._changed_keys(self[i]['kwargs'], kwargs)
         self[i]['kwargs'].update(kwargs)
+        self._mark_changed(self[i], changed)
 
     def edit_current(self, reset=False, **kwargs):
         if reset:
             self.gcl()['kwargs'] = kwargs
+            self._mark_changed(self.gcl(), None)
         else:
+            changed = self._changed_keys(self.gcl()['kwargs'], kwargs)
             self.gcl()['kwargs'].update(kwargs)
+            self._mark_changed(self.gcl(), changed)
 
         print(self)
 
@@ -223,17 +307,176 @@ class LayersContainer(list):
         self[:] = [self[i] for i in indices]
         self.current_index = len(self) - 1
 
+        # the drawing order follows from the order in which layers are plotted
+        for l in self:
+            self._mark_changed(l, None)
+
     def delete(self, i):
         del self[i]
 
-    def plot(self, ax):
-        r = []
+    def data_changed(self, d):
+        """
+        register that the data of a dataset changed in place (see Dataset.invalidate)
+        artists that follow the version of the dataset are updated when they are drawn,
+        only layers with other artists are plotted again
+        :return: True if the dataset is shown by a layer
+        """
+        found = False
         for l in self:
-            r.append(l['data'].plot(ax, **l['kwargs']))
+            if l['data'] is d:
+                if not self._follows_data(l):
+                    self._mark_changed(l, None)
+                found = True
+        return found
+
+    def _follows_data(self, layer):
+        """check if all plotted artists of a layer are updated by a view.ViewUpdater of its dataset"""
+        from . import view
+        try:
+            _, ax, artists = self._artists[id(layer)]
+        except KeyError:
+            return True
+        updated = set(id(a.artist) for a in ax.artists
+                      if isinstance(a, view.ViewUpdater) and a.dataset is layer['data'])
+        return all(id(a) in updated for a in self._iter_artists(artists))
+
+    @staticmethod
+    def _changed_keys(old, new):
+        """
+        keys of new kwargs with a value that differs from the old kwargs
+        the settings panels send all their fields with every edit, so most values are unchanged
+        """
+        changed = set()
+        for k, v in new.items():
+            try:
+                same = k in old and bool(np.all(old[k] == v))
+            except (TypeError, ValueError):
+                same = False
+            if not same:
+                changed.add(k)
+        return changed
+
+    def _mark_changed(self, layer, kwargs):
+        """
+        register changed kwargs of a layer
+        :param kwargs: changed kwargs or None if the layer must be plotted again
+        """
+        key = id(layer)
+        if key not in self._artists:
+            return
+        changes = self._changes.get(key, set())
+        if kwargs is None or changes is None:
+            self._changes[key] = None
+        else:
+            self._changes[key] = changes | set(kwargs)
+
+    def forget_artists(self):
+        """forget all plotted artists, e.g. after the axes are cleared"""
+        self._artists.clear()
+        self._changes.clear()
+        self._colors.clear()
+
+    def plot(self, ax, name=None):
+        """
+        plot all layers on an axes
+        layers that were plotted on the same axes before keep their artists:
+        changed kwargs are applied with the setters of the artists,
+        only if that is not possible the artists are removed and the layer is plotted again
+        artists of deleted layers are removed
+        :param name: name of the axes in the timings of the layers (see profiling)
+        :return: list of artists for each layer
+        """
+        with profiling.timed('LayersContainer.plot'):
+            return self._plot(ax, name)
+
+    def _plot(self, ax, name):
+        r = []
+        for i, l in enumerate(self):
+            artists = self._plot_layer(ax, l)
+            if profiling.registry.enabled:
+                layer_name = '{} {} {}'.format(name or 'axes', i, l['data'].LAYER_NAME)
+                for a in self._iter_artists(artists):
+                    profiling.profile_draw(a, layer_name)
+            r.append(artists)
+
+        keys = set(id(l) for l in self)
+        for key in list(self._artists):
+            if key not in keys:
+                _, prev_ax, artists = self._artists.pop(key)
+                self._changes.pop(key, None)
+                self._colors.pop(key, None)
+                if prev_ax is ax:
+                    self._remove_artists(artists)
         return r
 
+    def _plot_layer(self, ax, layer):
+        key = id(layer)
+        changes = self._changes.pop(key, set())
+        try:
+            _, prev_ax, artists = self._artists.pop(key)
+        except KeyError:
+            pass
+        else:
+            if prev_ax is ax:
+                if changes is not None and self._update_artists(artists, changes, layer['kwargs']):
+                    self._artists[key] = (layer, ax, artists)
+                    return artists
+                self._remove_artists(artists)
+
+        kwargs = layer['kwargs']
+        if 'color' not in kwargs and self._colors.get(key) is not None:
+            # a layer plotted again keeps its color instead of taking the next one of the property cycle
+            kwargs = dict(kwargs, color=self._colors[key])
+        with profiling.timed('Dataset.plot'):
+            artists = layer['data'].plot(ax, **kwargs)
+        if 'color' not in kwargs:
+            self._colors[key] = self._cycle_color(artists)
+        self._artists[key] = (layer, ax, artists)
+        return artists
+
+    def _cycle_color(self, artists):
+        """color of lines plotted without a color, which matplotlib takes from the property cycle"""
+        from matplotlib.lines import Line2D
+        artists = self._iter_artists(artists)
+        if artists and all(isinstance(a, Line2D) for a in artists):
+            return artists[0].get_color()
+        return None
+
+    @staticmethod
+    def _iter_artists(artists):
+        if isinstance(artists, (list, tuple)):
+            return list(artists)
+        return [artists]
+
+    def _update_artists(self, artists, keys, kwargs):
+        """
+        apply changed kwargs to existing artists
+        :return: False if a kwarg was removed or an artist has no setter for it
+        """
+        artists = self._iter_artists(artists)
+        for k in keys:
+            if k not in kwargs:
+                return False
+            for a in artists:
+                if not callable(getattr(a, 'set_{}'.format(k), None)):
+                    return False
+
+        for k in keys:
+            for a in artists:
+                getattr(a, 'set_{}'.format(k))(kwargs[k])
+        return True
+
+    def _remove_artists(self, artists):
+        for a in self._iter_artists(artists):
+            try:
+                a.remove()
+            except (NotImplementedError, ValueError):
+                # artist was already removed from its axes
+                pass
+
 
 if __name__ == '__main__':
+    from matplotlib import pyplot as plt
     fig = plt.figure()
     figman = FigureManager(fig)
     figman.format_axes(0,
@@ -0,0 +1,136 @@
+"""
+opt-in timing of the hot paths of easyplot
+
+timings are only recorded while the registry is enabled; disabled timers cost a single attribute check
+"""
+from collections import OrderedDict, deque
+from functools import partial
+import threading
+import time
+
+
+class Stats(object):
+    """
+    count and total time of a timed operation and a window of recent timings for percentiles
+    """
+
+    def __init__(self, size=1000):
+        self.count = 0
+        self.total = 0.
+        self.recent = deque(maxlen=size)
+
+    def add(self, dt):
+        self.count += 1
+        self.total += dt
+        self.recent.append(dt)
+
+    def percentile(self, q):
+        """percentile of the recent timings (nearest rank)"""
+        values = sorted(self.recent)
+        if not values:
+            return 0.
+        return values[min(int(round(q/100*(len(values) - 1))), len(values) - 1)]
+
+    def summary(self):
+        """dict with count, total, mean, p50 and p95 in seconds"""
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.total/self.count if self.count else 0.,
+            p50=self.percentile(50),
+            p95=self.percentile(95))
+
+
+class Timer(object):
+    """context manager recording the time of its block in a registry"""
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        self.t0 = None
+
+    def __enter__(self):
+        if self.registry.enabled:
+            self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.t0 is not None:
+            self.registry.record(self.name, time.perf_counter() - self.t0)
+            self.t0 = None
+
+
+class Registry(object):
+    """
+    stats of timed operations by name
+    timings may be recorded from any thread
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def timed(self, name):
+        return Timer(self, name)
+
+    def record(self, name, dt):
+        with self._lock:
+            try:
+                s = self.stats[name]
+            except KeyError:
+                s = self.stats[name] = Stats()
+            s.add(dt)
+
+    def summary(self, prefix=None):
+        """
+        :param prefix: only include names starting with prefix
+        :return: dict of Stats.summary by name
+        """
+        with self._lock:
+            return OrderedDict((k, s.summary()) for k, s in self.stats.items()
+                               if prefix is None or k.startswith(prefix))
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+
+# registry used by easyplot
+registry = Registry()
+
+# prefix of the names of the draw timings of layers (see profile_draw)
+LAYER_PREFIX = 'draw '
+
+
+def enable():
+    registry.enabled = True
+
+
+def disable():
+    registry.enabled = False
+
+
+def timed(name):
+    """
+    time a block of code
+        with profiling.timed('AxesManager.plot'):
+            ...
+    """
+    return Timer(registry, name)
+
+
+def profile_draw(artist, name):
+    """
+    time the draws of an artist as LAYER_PREFIX + name
+    artists that are already profiled keep their name
+    """
+    if getattr(artist, '_profile_name', None) is not None:
+        return
+    artist._profile_name = name
+    artist.draw = partial(_timed_draw, artist.draw, LAYER_PREFIX + name)
+
+
+def _timed_draw(draw, name, renderer, *args, **kwargs):
+    with Timer(registry, name):
+        return draw(renderer, *args, **kwargs)
@@ -0,0 +1,35 @@
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
+
+
+def render_rgba(fig):
+    """
+    render a figure with Agg
+    does not use the canvas of the figure, so it can be used on a copy of a figure on another thread
+    :return: uint8 array of shape (height, width, 4) with RGBA values
+    """
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    return np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8).reshape(height, width, 4)
+
+
+def rgba_to_argb32(rgba):
+    """
+    convert RGBA pixels to the byte order of a QImage with format ARGB32 (BGRA on little endian machines)
+    :return: contiguous uint8 array of the same shape
+    """
+    return np.ascontiguousarray(rgba[..., [2, 1, 0, 3]])
+
+
+def colormap_gradient(cmap, width=64, height=12):
+    """
+    render a horizontal gradient of a colormap
+    :param cmap: name or instance of a colormap
+    :return: uint8 array of shape (height, width, 4) with RGBA values
+    """
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+    row = cmap(np.linspace(0, 1, width), bytes=True)
+    return np.ascontiguousarray(np.broadcast_to(row, (height, width, 4)))
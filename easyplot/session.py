@@ -0,0 +1,163 @@
+import numpy as np
+import struct
+import json
+import os
+from collections import OrderedDict
+from matplotlib import colors
+from . import datasets
+from .managers import FigureManager, LayersContainer
+
+
+# file layout:
+#   header    magic, format version, offset and length of the manifest
+#   arrays    raw array data, each starting at a multiple of ALIGNMENT
+#   manifest  json with the layout of the figure and the location of the arrays
+MAGIC = b'EASYPLOT'
+VERSION = 1
+ALIGNMENT = 64
+_HEADER = struct.Struct('<8sIQQ')
+
+
+class InvalidSessionFile(Exception):
+    """
+    Exception raised when a file is not a session file or has an unsupported version
+    """
+
+
+def _to_json(v):
+    """convert values in settings and plot kwargs that json does not support"""
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, colors.Colormap):
+        # matplotlib accepts colormap names wherever a colormap is expected
+        return v.name
+    raise TypeError('{!r} can not be stored in a session'.format(v))
+
+
+def _align(f):
+    """pad the file to the next multiple of ALIGNMENT"""
+    pos = f.tell()
+    padding = -pos % ALIGNMENT
+    f.write(b'\0' * padding)
+    return pos + padding
+
+
+def save(figure_manager, path):
+    """
+    store the axes, settings and layers of a figure in a session file
+    dataset arrays are stored uncompressed and aligned, so they can be memory mapped by load
+    """
+    arrays = []
+    array_index = dict()
+
+    def add_array(a):
+        # arrays shared by several datasets are stored once
+        if id(a) not in array_index:
+            array_index[id(a)] = len(arrays)
+            arrays.append(a)
+        return array_index[id(a)]
+
+    axes = []
+    for a in figure_manager.axes:
+        layers = []
+        for l in a.layers:
+            d = l['data']
+            layer = dict(
+                type=d.__class__.__name__,
+                names=list(d.names),
+                arrays=[add_array(arr) for arr in d.axes],
+                kwargs=l['kwargs'])
+            if isinstance(d, datasets.StreamingTimeseries):
+                # the ring buffer is rebuilt with the same capacity from the samples it holds
+                layer['capacity'] = d.capacity
+            layers.append(layer)
+        axes.append(dict(
+            position=a.position,
+            settings=a.settings,
+            layers=layers,
+            current_layer=a.layers.current_index))
+
+    # the session is written to a temporary file that replaces the file at path when it is complete,
+    # so a failed save leaves no partial file and arrays memory mapped from the old file stay valid
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(b'\0' * _HEADER.size)
+
+            array_specs = []
+            for a in arrays:
+                offset = _align(f)
+                # fortran ordered arrays are written as they are instead of converting them
+                order = 'F' if a.flags.f_contiguous and not a.flags.c_contiguous else 'C'
+                data = a.T if order == 'F' else np.ascontiguousarray(a)
+                f.write(data.data)
+                array_specs.append(dict(offset=offset, dtype=a.dtype.str, shape=list(a.shape), order=order))
+
+            manifest = json.dumps(dict(
+                axrow_count=figure_manager.axrow_count(),
+                current_index=figure_manager.current_index,
+                axes=axes,
+                arrays=array_specs), default=_to_json).encode('utf-8')
+            manifest_offset = _align(f)
+            f.write(manifest)
+
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, VERSION, manifest_offset, len(manifest)))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def read_manifest(path):
+    """read the manifest of a session file without touching the arrays"""
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise InvalidSessionFile(path)
+        magic, version, offset, length = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise InvalidSessionFile('{} is not a session file'.format(path))
+        if version != VERSION:
+            raise InvalidSessionFile('unsupported session version {}'.format(version))
+        f.seek(offset)
+        return json.loads(f.read(length).decode('utf-8'), object_pairs_hook=OrderedDict)
+
+
+def load(path, fig):
+    """
+    restore a session in a figure
+    arrays are memory mapped read-only, so data is only read from disk when it is used
+    :return: FigureManager; call plot on its axes to draw the layers
+    """
+    manifest = read_manifest(path)
+
+    arrays = []
+    if manifest['arrays']:
+        mm = np.memmap(path, dtype=np.uint8, mode='r')
+        for spec in manifest['arrays']:
+            arrays.append(np.ndarray(tuple(spec['shape']), dtype=np.dtype(spec['dtype']), buffer=mm,
+                                     offset=spec['offset'], order=spec['order']))
+
+    data = []
+    for a in manifest['axes']:
+        layers = LayersContainer()
+        for l in a['layers']:
+            cls = getattr(datasets, l['type'])
+            args = [arrays[i] for i in l['arrays']]
+            if 'capacity' in l:
+                args.insert(0, l['capacity'])
+            d = cls(*args, names=tuple(l['names']))
+            layers.add(d, **l['kwargs'])
+        if layers:
+            layers.current_index = a['current_layer']
+        data.append((a['position'], layers, a['settings']))
+
+    figman = FigureManager(fig)
+    figman.create_axes(data)
+    figman._axrow_count = manifest['axrow_count']
+    figman.current_index = manifest['current_index']
+    return figman
@@ -0,0 +1,123 @@
+import numpy as np
+
+
+class GridIndex(object):
+    """
+    spatial index of 2d points that hashes the points into the cells of a grid
+    the edges of the columns and rows are quantiles of x and y, so clustered points are spread over many cells;
+    the points are sorted by cell, so the points of a row of cells are a contiguous range
+    """
+
+    # average number of points per cell
+    POINTS_PER_CELL = 4
+
+    # maximum number of points from which the edges of the cells are computed
+    EDGE_SAMPLE = 2**16
+
+    def __init__(self, x, y):
+        """
+        :param x: 1d array of x coordinates
+        :param y: 1d array of y coordinates; points with a non-finite coordinate are not indexed
+        """
+        self.x = x
+        self.y = y
+
+        valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        if valid.size == 0:
+            self.shape = (0, 0)
+            self.order = valid
+            return
+
+        vx, vy = x[valid], y[valid]
+        (xmin, xmax), (ymin, ymax) = (vx.min(), vx.max()), (vy.min(), vy.max())
+        width, height = xmax - xmin, ymax - ymin
+
+        # the number of columns and rows follows the extent of the points
+        ncells = max(valid.size / self.POINTS_PER_CELL, 1)
+        if width > 0 and height > 0:
+            nx = int(np.sqrt(ncells*width/height))
+        else:
+            nx = int(ncells) if width > 0 else 1
+        nx = max(min(nx, int(ncells)), 1)
+        ny = max(int(ncells // nx), 1) if height > 0 else 1
+        self.shape = (ny, nx)
+        # each column and row holds about the same number of points; the outer edges are the extrema,
+        # so the points left out of the sample are inside the grid as well
+        step = max(valid.size // self.EDGE_SAMPLE, 1)
+        self.xedges = np.quantile(vx[::step], np.linspace(0, 1, nx + 1))
+        self.yedges = np.quantile(vy[::step], np.linspace(0, 1, ny + 1))
+        self.xedges[[0, -1]] = xmin, xmax
+        self.yedges[[0, -1]] = ymin, ymax
+
+        cells = self._cells(vx, vy)
+        order = np.argsort(cells, kind='stable')
+        self.order = valid[order]
+        # points of cell c are order[offsets[c]:offsets[c+1]]
+        self.offsets = np.zeros(ny*nx + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cells, minlength=ny*nx), out=self.offsets[1:])
+
+    def _cell(self, x, y):
+        col = int(np.searchsorted(self.xedges[1:-1], x, side='right'))
+        row = int(np.searchsorted(self.yedges[1:-1], y, side='right'))
+        return row, col
+
+    def _cells(self, x, y):
+        col = np.searchsorted(self.xedges[1:-1], x, side='right')
+        row = np.searchsorted(self.yedges[1:-1], y, side='right')
+        return row*self.shape[1] + col
+
+    def _window(self, row, col, r):
+        """indices of the points in the cells within r cells of (row, col)"""
+        ny, nx = self.shape
+        c0, c1 = max(col - r, 0), min(col + r, nx - 1)
+        parts = []
+        for i in range(max(row - r, 0), min(row + r, ny - 1) + 1):
+            parts.append(self.order[self.offsets[i*nx + c0]:self.offsets[i*nx + c1 + 1]])
+        return np.concatenate(parts)
+
+    def nearest(self, x, y, scale=(1, 1), maxdist=np.inf):
+        """
+        find the point nearest to a location
+        the search grows a window of cells around the location until no cell outside it can be nearer
+        :param scale: (sx, sy) factors applied to x and y distances, e.g. pixels per data unit,
+                      so the distance is measured on screen
+        :param maxdist: maximum (scaled) distance
+        :return: (index, distance) of the nearest point or None if there is no point within maxdist
+        """
+        ny, nx = self.shape
+        if ny == 0:
+            return None
+        sx, sy = abs(scale[0]), abs(scale[1])
+
+        row, col = self._cell(x, y)
+        r = 1
+        best = None
+        while True:
+            idx = self._window(row, col, r)
+            if idx.size:
+                d = np.hypot((self.x[idx] - x)*sx, (self.y[idx] - y)*sy)
+                i = np.argmin(d)
+                best = int(idx[i]), float(d[i])
+            # every point outside the window is at least the distance to its nearest inner edge away
+            bound = self._outside(x, y, row, col, r, sx, sy)
+            if (best is not None and best[1] <= bound) or np.isinf(bound) or bound > maxdist:
+                break
+            r *= 2
+
+        if best is None or best[1] > maxdist:
+            return None
+        return best
+
+    def _outside(self, x, y, row, col, r, sx, sy):
+        """scaled distance from (x, y) to the nearest edge of the window that has cells outside of it"""
+        ny, nx = self.shape
+        bound = np.inf
+        if col - r > 0:
+            bound = min(bound, (x - self.xedges[col - r])*sx)
+        if col + r < nx - 1:
+            bound = min(bound, (self.xedges[col + r + 1] - x)*sx)
+        if row - r > 0:
+            bound = min(bound, (y - self.yedges[row - r])*sy)
+        if row + r < ny - 1:
+            bound = min(bound, (self.yedges[row + r + 1] - y)*sy)
+        return bound
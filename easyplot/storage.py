@@ -0,0 +1,84 @@
+import numpy as np
+import zipfile
+import struct
+import os
+from collections import OrderedDict
+
+
+# size of the fixed part of a zip local file header
+_ZIP_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def is_path(v):
+    """check if a value refers to a file"""
+    return isinstance(v, (str, bytes, os.PathLike))
+
+
+def load_npy(path, mmap=True):
+    """
+    load an array from a .npy file
+    :param mmap: open the array read-only as a memory map instead of reading it into memory
+    """
+    return np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+
+
+def load_npz(path, mmap=True):
+    """
+    load all arrays from a .npz file
+    members that are stored uncompressed (np.savez) are memory mapped directly from the archive,
+    compressed members (np.savez_compressed) can only be read into memory
+    :param mmap: open arrays read-only as memory maps if possible
+    :return: OrderedDict of name: array in the order of the archive
+    """
+    arrays = OrderedDict()
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            if name.endswith('.npy'):
+                name = name[:-4]
+
+            a = None
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                a = _memmap_member(path, info)
+            if a is None:
+                with zf.open(info) as f:
+                    a = np.lib.format.read_array(f, allow_pickle=False)
+            arrays[name] = a
+    return arrays
+
+
+def _memmap_member(path, info):
+    """
+    memory map an uncompressed .npy member of a zip archive
+    :return: numpy.memmap or None if the member cannot be memory mapped
+    """
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+        name_length, extra_length = header[-2:]
+        f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+
+    if dtype.hasobject or shape == ():
+        return None
+
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def load(path, mmap=True):
+    """
+    load the arrays in a .npy or .npz file
+    :return: list of arrays
+    """
+    if os.fsdecode(path).endswith('.npz'):
+        return list(load_npz(path, mmap=mmap).values())
+    return [load_npy(path, mmap=mmap)]
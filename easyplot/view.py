@@ -0,0 +1,163 @@
+from matplotlib.artist import Artist
+from matplotlib.cm import ScalarMappable
+from matplotlib.quiver import Quiver
+import numpy as np
+from . import profiling
+
+
+def pixel_size(ax):
+    """size of the axes in pixels as (width, height)"""
+    bbox = ax.get_window_extent()
+    return max(int(bbox.width), 1), max(int(bbox.height), 1)
+
+
+def pixel_scale(ax):
+    """number of pixels per data unit in x and y as (sx, sy)"""
+    width, height = pixel_size(ax)
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    return width/abs(x1 - x0), height/abs(y1 - y0)
+
+
+def view_key(ax):
+    """
+    summary of everything that determines what part of the data is visible in an axes and at which resolution
+    """
+    return tuple(ax.get_xlim()), tuple(ax.get_ylim()), pixel_size(ax)
+
+
+class ViewUpdater(Artist):
+    """
+    invisible artist that calls a function whenever the view (limits or pixel size) of its axes has changed
+    it is drawn before all other artists, so updates of artist data are used in the same draw
+    the updater removes itself once the artist it updates is no longer part of the axes
+
+    the function should not hold references to artists itself, but use the artist it is called with,
+    so a copy of the figure (see FigureManager.snapshot) updates its own artists
+    if the function replaces the artist by a new one, it returns the new artist, which is drawn immediately
+    """
+
+    zorder = -np.inf
+
+    def __init__(self, artist, func, dataset=None):
+        """
+        :param artist: artist that is updated
+        :param func: function called as func(ax, artist) when the view has changed
+        :param dataset: dataset shown by the artist; the function is also called when its version changed
+        """
+        super().__init__()
+        self.artist = artist
+        self.func = func
+        self.dataset = dataset
+        self._view = None
+        self.set_in_layout(False)
+
+    def draw(self, renderer):
+        ax = self.axes
+        if ax is None:
+            return
+        if self.artist.axes is not ax:
+            self.remove()
+            return
+
+        view = self._key(ax)
+        if view != self._view:
+            new = self.func(ax, self.artist)
+            if new is not None:
+                # the new artist was added after the axes collected the artists to draw
+                self.artist = new
+                new.draw(renderer)
+            # the function may have changed the view itself
+            self._view = self._key(ax)
+        self.stale = False
+
+    def _key(self, ax):
+        return view_key(ax), getattr(self.dataset, 'version', None)
+
+
+def attach(ax, artist, func, dataset=None):
+    """
+    call func(ax, artist) when the view of ax or the version of dataset changes until artist is removed from ax
+    :return: the ViewUpdater instance
+    """
+    updater = ViewUpdater(artist, func, dataset=dataset)
+    ax.add_artist(updater)
+    return updater
+
+
+def copy_properties(new, old):
+    """copy the properties of an artist that can be changed after it is created to its replacement"""
+    Artist.update_from(new, old)
+    new.set_zorder(old.get_zorder())
+    if isinstance(old, ScalarMappable):
+        # a shared norm keeps the colors the same for all replacements
+        new.set_cmap(old.get_cmap())
+        new.set_norm(old.norm)
+    if isinstance(old, Quiver) and isinstance(new, Quiver) and new.scale is None:
+        # the scale is computed when a quiver is first drawn; reusing it keeps the arrow lengths while zooming
+        new.scale = old.scale
+
+
+class ArtistReplacer(object):
+    """
+    view update for artists that can not be updated in place
+    a new artist is created whenever the selection (e.g. a level of detail and the visible window) changes
+    the properties of the old artist are copied to the new one, the old artist is hidden and removed after the draw
+    the current artist is kept in the list artists, which is returned to the code that plotted it
+    """
+
+    def __init__(self, select, create, dataset=None):
+        """
+        :param select: function select(ax) returning a (comparable) selection of the data for the view
+        :param create: function create(ax, selection) returning a new artist added to ax
+        :param dataset: dataset shown by the artist (see ViewUpdater)
+        """
+        self.select = select
+        self.create = create
+        self.dataset = dataset
+        self.selection = None
+        self.artists = []
+        # replaced artists that are removed after the current draw
+        self.retired = []
+        self._cid = None
+
+    def plot(self, ax):
+        """
+        create the artist for the current view
+        :return: list with the current artist
+        """
+        self.selection = self.select(ax)
+        artist = self.create(ax, self.selection)
+        self.artists[:] = [artist]
+        attach(ax, artist, self, dataset=self.dataset)
+        return self.artists
+
+    def __call__(self, ax, artist):
+        selection = self.select(ax)
+        if selection == self.selection:
+            return None
+        self.selection = selection
+
+        new = self.create(ax, selection)
+        copy_properties(new, artist)
+        name = getattr(artist, '_profile_name', None)
+        if name is not None:
+            profiling.profile_draw(new, name)
+        # the axes may be drawing and have collected the old artist already, it is removed after the draw
+        artist.set_visible(False)
+        self.retired.append(artist)
+        if self._cid is None:
+            self._cid = ax.figure.canvas.mpl_connect('draw_event', self._remove_retired)
+        self.artists[:] = [new]
+        return new
+
+    def _remove_retired(self, event):
+        event.canvas.mpl_disconnect(self._cid)
+        self._cid = None
+        for a in self.retired:
+            try:
+                a.remove()
+            except (NotImplementedError, ValueError):
+                # artist was already removed from its axes
+                pass
+        del self.retired[:]
+
@@ -0,0 +1,33 @@
+import unittest
+from easyplot import aggregation
+import numpy as np
+
+
+class TestRasterize(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.array([.5, .5, 1.5, 3.5, np.nan, 5.])
+        self.y = np.array([.5, .5, .5, 1.5, .5, .5])
+        self.z = np.array([1., 3., 2., 4., 5., 6.])
+
+    def test_count(self):
+        r = aggregation.rasterize(self.x, self.y, (0, 4), (0, 2), (2, 4))
+        np.testing.assert_array_equal(r, [[2, 1, np.nan, np.nan],
+                                          [np.nan, np.nan, np.nan, 1]])
+
+    def test_reversed(self):
+        r = aggregation.rasterize(self.x, self.y, (4, 0), (0, 2), (2, 4))
+        np.testing.assert_array_equal(r[0], [np.nan, np.nan, 1, 2])
+
+    def test_statistics(self):
+        for statistic, expected in (('mean', 2), ('min', 1), ('max', 3)):
+            r = aggregation.rasterize(self.x, self.y, (0, 4), (0, 2), (2, 4), values=self.z, statistic=statistic)
+            self.assertEqual(r[0, 0], expected)
+            self.assertEqual(r[1, 3], 4)
+            self.assertTrue(np.isnan(r[1, 0]))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            aggregation.rasterize(self.x, self.y, (0, 4), (0, 2), (2, 4), statistic='mean')
+        with self.assertRaises(ValueError):
+            aggregation.rasterize(self.x, self.y, (0, 4), (0, 2), (2, 4), values=self.z, statistic='median')
@@ -0,0 +1,57 @@
+import unittest
+import contextlib
+import tempfile
+import io
+import shutil
+import json
+import os
+from easyplot import batch
+import numpy as np
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(3):
+            self.paths.append(os.path.join(self.dir, 'series{}.npz'.format(i)))
+            t = np.linspace(0, 1, 1000)
+            np.savez(self.paths[-1], t=t, v=np.sin((i+1)*t), y=np.arange(10.), z=np.random.rand(10, 1000))
+        self.layout = dict(
+            axes=2, rows=2, figsize=[4, 3], dpi=50,
+            settings=[dict(title='series'), dict(xlabel='t')],
+            layers=[dict(axes=0, arrays=['t', 'v'], kwargs=dict(color='r', decimate='minmax')),
+                    dict(axes=1, arrays=['t', 'y', 'z'], type='Grid')])
+
+    def test_build(self):
+        figman = batch.build_figure(self.layout, self.paths[0])
+        self.assertEqual(figman.ax_count(), 2)
+        self.assertEqual(figman.axes[0].ax.get_title(), 'series')
+        self.assertEqual(len(figman.axes[0].layers), 1)
+        self.assertEqual(len(figman.axes[1].ax.images), 1)
+
+    def test_render_jobs(self):
+        outdir = os.path.join(self.dir, 'out')
+        results = batch.render_jobs(self.layout, self.paths, outdir, fmt='pdf', workers=2)
+        self.assertEqual([r[2] for r in results], [None]*3)
+        for _, output, _ in results:
+            self.assertTrue(os.path.exists(output))
+            self.assertTrue(output.endswith('.pdf'))
+
+    def test_main(self):
+        layout = os.path.join(self.dir, 'layout.json')
+        with open(layout, 'w') as f:
+            json.dump(dict(layers=[dict(arrays=['t', 'v'])]), f)
+        outdir = os.path.join(self.dir, 'out')
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            self.assertEqual(batch.main([layout, self.paths[0], '-o', outdir, '-j', '1']), 0)
+            missing = os.path.join(self.dir, 'missing.npz')
+            self.assertEqual(batch.main([layout, missing, '-o', outdir, '-j', '1']), 1)
+        self.assertTrue(os.path.exists(os.path.join(outdir, 'series0.png')))
+        self.assertIn('{} -> {}'.format(self.paths[0], os.path.join(outdir, 'series0.png')), stdout.getvalue())
+        self.assertIn('{} failed'.format(missing), stderr.getvalue())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
@@ -0,0 +1,26 @@
+import unittest
+import benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_collect(self):
+        names = [n for n, _ in benchmarks.collect()]
+        self.assertIn('datasets.limits', names)
+        self.assertEqual([n for n, _ in benchmarks.collect('rendering.draw')], ['rendering.draw'])
+
+    def test_smallest(self):
+        self.assertEqual(benchmarks._smallest([('a', 10), ('a', 1), ('b', 1)]), [('a', 1), ('b', 1)])
+        self.assertEqual(benchmarks._smallest([4, 16]), [4])
+
+    def test_compare(self):
+        baseline = dict(results={'a[1]': dict(min=1.), 'b[1]': dict(min=1.)})
+        results = dict(results={'a[1]': dict(min=1.1), 'b[1]': dict(min=2.), 'c[1]': dict(min=1.)})
+        self.assertEqual(benchmarks.compare(results, baseline), [('a[1]', 1.1, False), ('b[1]', 2., True)])
+
+    def test_percentile(self):
+        from benchmarks import interaction
+        values = [4., 1, 3, 2]
+        self.assertEqual(interaction.percentile(values, 50), 2.5)
+        self.assertEqual(interaction.percentile(values, 100), 4)
+        self.assertEqual(interaction.percentile([1.], 90), 1)
@@ -0,0 +1,99 @@
+import unittest
+from easyplot import channel, datasets, managers
+import numpy as np
+
+
+class TestChannel(unittest.TestCase):
+
+    def setUp(self):
+        # local stand-in for a producer in another process
+        self.t = np.linspace(0, 1, 1000)
+        self.writer = channel.ChannelWriter.like(self.t, self.t, dataset_type='Timeseries')
+        self.reader = channel.ChannelReader(self.writer.name)
+
+    def test_publish(self):
+        self.assertEqual(self.reader.sequence, 0)
+        self.assertFalse(self.reader.poll())
+
+        self.writer.publish(self.t, self.t**2)
+        self.assertEqual(self.reader.sequence, 1)
+        self.assertTrue(self.reader.poll())
+        self.assertFalse(self.reader.poll())
+        np.testing.assert_array_equal(self.reader.arrays[1], self.t**2)
+        for a in self.reader.arrays:
+            self.assertEqual(a.ctypes.data % channel.ALIGNMENT, 0)
+            self.assertFalse(a.flags.writeable)
+
+    def test_dataset(self):
+        self.writer.publish(self.t, self.t)
+        self.reader.poll()
+        d = self.reader.dataset()
+        self.assertIsInstance(d, datasets.Timeseries)
+        self.assertIs(d.axes[0], self.reader.arrays[0])
+        self.assertEqual(d.extrema(1), (0, 1))
+
+        layers = managers.LayersContainer(d)
+        self.writer.publish(self.t, 2*self.t)
+        self.assertTrue(self.reader.poll())
+        self.assertIs(d.axes[1], self.reader.arrays[1])
+        self.assertEqual(d.extrema(1), (0, 2))
+        self.assertTrue(layers.data_changed(d))
+        self.assertFalse(layers.data_changed(datasets.Timeseries(self.t, self.t)))
+        del d, layers
+
+    def test_copy(self):
+        self.writer.publish(self.t, self.t)
+        self.assertTrue(self.reader.poll())
+        for a in self.reader.arrays:
+            self.assertEqual(a.ctypes.data % channel.ALIGNMENT, 0)
+
+        # a publication in progress is not accepted and the accepted arrays keep their values
+        self.writer._sequence[0] += 1
+        self.writer.arrays[1][:] = -1
+        self.assertFalse(self.reader.poll())
+        np.testing.assert_array_equal(self.reader.arrays[1], self.t)
+        self.writer._sequence[0] += 1
+        accepted = self.reader.arrays[1]
+        self.assertTrue(self.reader.poll())
+        np.testing.assert_array_equal(self.reader.arrays[1], -1)
+        # arrays that may still be drawn are not overwritten by the next publication
+        np.testing.assert_array_equal(accepted, self.t)
+        self.assertFalse(accepted.flags.writeable)
+
+        reader = channel.ChannelReader(self.writer.name, copy=False)
+        self.writer.arrays[1][:] = 2
+        self.assertEqual(reader.arrays[1][0], 2)
+        reader.close()
+
+    def test_data_changed(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        canvas = FigureCanvasAgg(Figure())
+        ax = canvas.figure.add_subplot(111)
+        self.writer.publish(self.t, self.t)
+        self.reader.poll()
+        d = self.reader.dataset()
+        layers = managers.LayersContainer()
+        layers.add(d, decimate='minmax')
+        line, = layers.plot(ax)[0]
+
+        # the line follows the dataset version, so it is kept
+        self.writer.publish(self.t, 2*self.t)
+        self.reader.poll()
+        self.assertTrue(layers.data_changed(d))
+        self.assertEqual(layers.plot(ax)[0], [line])
+        canvas.draw()
+        self.assertEqual(line.get_ydata().max(), 2)
+        del d, layers
+
+    def test_interpret(self):
+        x = np.linspace(0, 1, 10)
+        writer = channel.ChannelWriter.like(x, x, np.zeros((10, 10)))
+        reader = channel.ChannelReader(writer.name)
+        self.assertIsInstance(reader.dataset(), datasets.Grid)
+        reader.close()
+        writer.close()
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
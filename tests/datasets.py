@@ -36,4 +36,473 @@ class TestInterpret(unittest.TestCase):
                 np.random.rand(10, 10),
                 np.random.rand(10, 10),
                 np.random.rand(10, 10)),
-            datasets.IrregularGrid)
\ No newline at end of file
+            datasets.IrregularGrid)
+
+
+class TestTimeseriesDecimation(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        self.fig = Figure(figsize=(4, 3), dpi=100)
+        self.ax = self.fig.add_axes([0, 0, 1, 1])
+        t = np.linspace(0, 1, 100000)
+        self.ts = datasets.Timeseries(t, np.sin(50*t))
+
+    def test_decimate(self):
+        for method in ('lttb', 'minmax'):
+            line, = self.ts.plot(self.ax, decimate=method)
+            self.assertEqual(line.get_xdata().size, 400*datasets.Timeseries.DECIMATION_DENSITY)
+
+    def test_resize(self):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        canvas = FigureCanvasAgg(self.fig)
+        line, = self.ts.plot(self.ax, decimate='minmax')
+        self.fig.set_size_inches(2, 3)
+        canvas.draw()
+        self.assertEqual(line.get_xdata().size, 200*datasets.Timeseries.DECIMATION_DENSITY)
+
+    def test_full(self):
+        line, = self.ts.plot(self.ax)
+        self.assertEqual(line.get_xdata().size, 100000)
+
+
+class TestTimeseriesViewport(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure(figsize=(4, 3), dpi=100)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0, 0, 1, 1])
+        self.t = np.arange(100000.)
+        self.ts = datasets.Timeseries(self.t, np.sin(self.t/1000)*self.t)
+
+    def test_visible_slice(self):
+        s = self.ts.visible_slice((100.5, 200.5))
+        self.assertEqual((s.start, s.stop), (100, 202))
+        s = self.ts.visible_slice((100.5, 200.5), pad=0)
+        self.assertEqual((s.start, s.stop), (101, 201))
+        unsorted = datasets.Timeseries(np.random.rand(10), np.random.rand(10))
+        self.assertEqual(unsorted.visible_slice((0, .5)), slice(None))
+
+    def test_clipped(self):
+        line, = self.ts.plot(self.ax)
+        self.assertEqual(line.get_xdata().size, self.t.size)
+        self.ax.set_xlim(1000, 2000)
+        self.canvas.draw()
+        xdata = line.get_xdata()
+        self.assertEqual((xdata[0], xdata[-1]), (999, 2001))
+
+    def test_yautoscale(self):
+        self.ts.plot(self.ax, yautoscale=True)
+        self.ax.set_xlim(0, 1000)
+        self.canvas.draw()
+        (_, _), (ymin, ymax) = self.ts.visible_limits((0, 1000))
+        self.assertEqual(tuple(self.ax.get_ylim()), (ymin, ymax))
+        self.assertLess(ymax, self.ts.limits()[1][1])
+
+
+class TestLimits(unittest.TestCase):
+
+    def test_nanminmax(self):
+        a = np.random.rand(1000)
+        a[[3, 500]] = np.nan
+        self.assertEqual(datasets.nanminmax(a, chunksize=64), (np.nanmin(a), np.nanmax(a)))
+        self.assertTrue(np.isnan(datasets.nanminmax(np.array([np.nan, np.nan]))).all())
+        self.assertEqual(datasets.nanminmax(np.arange(12).reshape(3, 4)), (0, 11))
+
+    def test_cached(self):
+        x = np.linspace(0, 1, 100)
+        d = datasets.Timeseries(x, x**2)
+        xlim, ylim = d.limits()
+        self.assertEqual(d.extrema(0), (0, 1))
+        d.axes[1][:] = 2*x
+        # in place changes require invalidation
+        self.assertEqual(d.extrema(1), (0, 1))
+        d.invalidate()
+        self.assertEqual(d.extrema(1), (0, 2))
+        d.axes = [x, 3*x]
+        self.assertEqual(d.extrema(1), (0, 3))
+
+
+class TestScans(unittest.TestCase):
+
+    def test_increasing(self):
+        v = np.linspace(0, 1, 100001)
+        self.assertTrue(datasets.Dataset.is_increasing(v, chunksize=1000))
+        v[50000] = v[49999]
+        self.assertFalse(datasets.Dataset.is_increasing(v, chunksize=1000))
+        self.assertFalse(datasets.Dataset.is_increasing(np.random.rand(100)))
+        self.assertFalse(datasets.Dataset.is_increasing(np.zeros((2, 2))))
+
+    def test_equidistant(self):
+        v = np.linspace(0, 1, 100001)
+        self.assertTrue(datasets.Dataset.is_equidistant(v, chunksize=1000))
+        self.assertTrue(datasets.Dataset.is_equidistant(1e6 + np.arange(100000)*1e-3))
+        v[50000] += 1e-6
+        self.assertFalse(datasets.Dataset.is_equidistant(v, chunksize=1000))
+        self.assertFalse(datasets.Dataset.is_equidistant(np.logspace(0, 1, 100)))
+        self.assertFalse(datasets.Dataset.is_equidistant(np.zeros(10)))
+
+    def test_probe(self):
+        x = np.linspace(0, 1, 10)
+        axes = datasets.probe([x, x, np.random.rand(10, 10)])
+        self.assertIs(datasets.probe(axes), axes)
+        self.assertTrue(axes.is_equidistant(0))
+        axes[0] = np.random.rand(10)
+        # results are remembered
+        self.assertTrue(axes.is_equidistant(0))
+        self.assertFalse(datasets.Grid.has_signature(axes[:2]))
+        self.assertTrue(datasets.Grid.has_signature(axes))
+        self.assertFalse(datasets.IrregularGrid.has_signature(axes))
+
+
+class TestStreamingTimeseries(unittest.TestCase):
+
+    def setUp(self):
+        datasets.StreamingTimeseries.BLOCK_SIZE = 16
+        self.ts = datasets.StreamingTimeseries(100)
+
+    def tearDown(self):
+        datasets.StreamingTimeseries.BLOCK_SIZE = 4096
+
+    def test_append(self):
+        self.assertEqual(len(self.ts), 0)
+        self.ts.append(np.arange(30.), np.arange(30.))
+        self.assertEqual(len(self.ts), 30)
+        t, v = self.ts.axes
+        np.testing.assert_array_equal(t, np.arange(30.))
+
+        # wrap around the end of the buffer; oldest samples are dropped
+        for i in range(3, 10):
+            self.ts.append(np.arange(i*10., i*10 + 10), np.arange(i*10., i*10 + 10))
+        t, v = self.ts.axes
+        self.assertEqual(len(self.ts), 100)
+        np.testing.assert_array_equal(t, np.arange(100.))
+        self.ts.append(np.arange(100., 250.), np.arange(100., 250.))
+        t, v = self.ts.axes
+        np.testing.assert_array_equal(t, np.arange(150., 250.))
+
+        with self.assertRaises(datasets.InvalidAxes):
+            self.ts.append([10.], [1.])
+
+    def test_extrema(self):
+        v = np.random.rand(1000)
+        v[10] = 5
+        v[300] = -5
+        for i in range(0, 1000, 37):
+            self.ts.append(np.arange(i, min(i + 37, 1000)), v[i:i+37])
+            t, vis = self.ts.axes
+            self.assertEqual(self.ts.extrema(0), (t[0], t[-1]))
+            self.assertEqual(self.ts.extrema(1), (vis.min(), vis.max()))
+        xlim, ylim = self.ts.limits()
+        self.assertLess(ylim[1], 5)
+
+    def test_plot(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure()
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        line, = self.ts.plot(ax)
+        self.ts.append(np.arange(50.), np.random.rand(50))
+        canvas.draw()
+        self.assertEqual(line.get_xdata().size, 50)
+        self.ts.append(np.arange(50., 80.), np.random.rand(30))
+        canvas.draw()
+        self.assertEqual(ax.lines[:], [line])
+        self.assertEqual(line.get_xdata()[-1], 79)
+        self.assertEqual(tuple(ax.get_xlim()), (0, 79))
+
+
+class TestGridLevelOfDetail(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure(figsize=(2, 2), dpi=50)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0, 0, 1, 1])
+        self.x = np.arange(1000.)
+        self.y = np.arange(800.)
+        self.z = np.add.outer(self.y, self.x)
+        self.grid = datasets.Grid(self.x, self.y, self.z)
+
+    def test_level(self):
+        x, y, z = self.grid.level(1)
+        self.assertEqual(z.shape, (400, 500))
+        np.testing.assert_array_equal(x, self.x.reshape(-1, 2).mean(axis=1))
+        self.assertEqual(z[0, 0], self.z[:2, :2].mean())
+        x, y, z = self.grid.level(3, reduce='max')
+        self.assertEqual(z.shape, (100, 125))
+        self.assertEqual(z[0, 0], self.z[:8, :8].max())
+        self.assertIs(self.grid.level(3, reduce='max')[2], z)
+
+    def test_level_nan(self):
+        z = self.z.copy()
+        z[0, 0] = np.nan
+        x, y, z = datasets.Grid(self.x, self.y, z).level(1)
+        self.assertEqual(z[0, 0], self.z[:2, :2].ravel()[1:].mean())
+
+    def test_bands(self):
+        z = self.z.copy()
+        z[::7, ::3] = np.nan
+        for reduce in ('mean', 'min', 'max'):
+            np.testing.assert_array_equal(datasets._reduce_blocks(z, reduce, chunksize=1000),
+                                          datasets._reduce_blocks(z, reduce, chunksize=z.size))
+        self.assertEqual(datasets._reduce_blocks(np.arange(16).reshape(4, 4), 'mean')[0, 0], 2.5)
+
+    def test_select_level(self):
+        self.ax.set_xlim(0, 999)
+        self.ax.set_ylim(0, 799)
+        _, k, (y0, y1), (x0, x1), _ = self.grid.select_level(self.ax)
+        self.assertEqual(k, 4)
+        self.ax.set_xlim(100, 150)
+        self.ax.set_ylim(100, 150)
+        _, k, (y0, y1), (x0, x1), _ = self.grid.select_level(self.ax)
+        self.assertEqual(k, 0)
+        self.assertEqual((x0, x1), (99, 152))
+
+    def test_plot(self):
+        artists = self.grid.plot(self.ax, method='pcolormesh', lod=True)
+        mesh, = artists
+        xmin, xmax = self.ax.get_xlim()
+        self.assertTrue(xmin <= 0 and xmax >= 999)
+        self.assertLess(mesh.get_array().size, self.z.size // 100)
+        # the first level is selected for the autoscaled view of the entire grid
+        _, k, _, _, _ = self.grid.select_level(self.ax)
+        self.assertEqual(mesh.get_array().shape, self.grid.level(k)[2].shape)
+        self.ax.set_xlim(100, 150)
+        self.ax.set_ylim(100, 150)
+        self.canvas.draw()
+        zoomed, = artists
+        self.assertIsNot(zoomed, mesh)
+        self.assertEqual(self.ax.collections[:], [zoomed])
+        self.assertEqual(zoomed.get_array()[0, 0], self.z[99, 99])
+
+
+class TestGridPlotMethod(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure()
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111)
+        self.z = np.random.rand(3, 4)
+
+    def test_method(self):
+        self.assertEqual(datasets.Grid(np.arange(4.), np.arange(3.), self.z).plot_method(), 'imshow')
+        self.assertEqual(datasets.Grid(np.array([0., 1, 3, 7]), np.arange(3.), self.z).plot_method(), 'nonuniform')
+        self.assertEqual(datasets.Grid(np.array([0., 1, 3, 7]), np.array([2., 0, 1]), self.z).plot_method(),
+                         'pcolormesh')
+
+    def test_imshow(self):
+        im = datasets.Grid(np.arange(4.), np.arange(3.)[::-1], self.z).plot(self.ax)
+        self.assertEqual(tuple(im.get_extent()), (-.5, 3.5, -.5, 2.5))
+        np.testing.assert_array_equal(im.get_array(), self.z[::-1])
+        self.assertEqual(tuple(self.ax.get_ylim()), (-.5, 2.5))
+
+    def test_aspect(self):
+        self.ax.set_aspect('equal')
+        datasets.Grid(np.arange(4.), np.arange(3.), self.z).plot(self.ax)
+        self.assertEqual(self.ax.get_aspect(), 1)
+        self.ax.set_aspect('auto')
+        datasets.Grid(np.arange(4.), np.arange(3.), self.z).plot(self.ax)
+        self.assertEqual(self.ax.get_aspect(), 'auto')
+
+    def test_override(self):
+        grid = datasets.Grid(np.arange(4.), np.arange(3.), self.z)
+        grid.plot(self.ax, method='pcolormesh')
+        self.assertEqual(len(self.ax.collections), 1)
+        grid.plot(self.ax, method='nonuniform')
+        self.assertEqual(len(self.ax.images), 1)
+        with self.assertRaises(ValueError):
+            grid.plot(self.ax, method='contour')
+
+
+class TestIrregularGrid(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure()
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111)
+        j, i = np.mgrid[:20, :30].astype(float)
+        self.x, self.y = i + .1*j, j - .1*i
+        self.z = np.hypot(self.x, self.y)
+        self.grid = datasets.IrregularGrid(self.x, self.y, self.z)
+
+    def test_triangulation(self):
+        tri = self.grid.triangulation()
+        self.assertEqual(tri.triangles.shape, (2*19*29, 3))
+        self.assertIs(self.grid.triangulation(), tri)
+        self.assertFalse(tri.mask.any())
+
+    def test_triangulation_invalid(self):
+        self.z[5, 5] = np.nan
+        self.x[0, 0] = np.nan
+        tri = datasets.IrregularGrid(self.x, self.y, self.z).triangulation()
+        # an interior node is part of 6 triangles, the corner node of both triangles of its cell
+        self.assertEqual(tri.mask.sum(), 6 + 2)
+        self.assertTrue(np.isfinite(tri.x).all())
+
+    def test_plot(self):
+        from matplotlib.collections import QuadMesh
+        self.assertIsInstance(self.grid.plot(self.ax), QuadMesh)
+        self.assertIsInstance(self.grid.plot(self.ax, shading='gouraud'), QuadMesh)
+        self.grid.plot(self.ax, method='tripcolor')
+        self.grid.plot(self.ax, method='tricontourf', levels=5)
+        self.canvas.draw()
+        self.assertEqual(len(self.ax.collections), 4)
+        with self.assertRaises(ValueError):
+            self.grid.plot(self.ax, method='pcolor')
+
+
+class TestPointsAggregation(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure(figsize=(2, 2), dpi=50)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0, 0, 1, 1])
+        self.x = np.random.rand(10000)
+        self.y = np.random.rand(10000)
+
+    def test_auto(self):
+        points = datasets.Points(self.x, self.y)
+        points.AGGREGATE_THRESHOLD = 1000
+        im = points.plot(self.ax)
+        self.assertEqual(im.get_array().shape, (100, 100))
+        self.assertEqual(np.nansum(im.get_array()), 10000)
+
+    def test_zoom(self):
+        im = datasets.Points(self.x, self.y).plot(self.ax, aggregate=True)
+        self.ax.set_xlim(0, .5)
+        self.canvas.draw()
+        self.assertEqual(tuple(im.get_extent()[:2]), (0, .5))
+        self.assertEqual(np.nansum(im.get_array()), np.sum((self.x < .5) & (self.y >= self.ax.get_ylim()[0])
+                                                           & (self.y < self.ax.get_ylim()[1])))
+
+    def test_values(self):
+        z = np.round(self.x)
+        im = datasets.ValuePoints(self.x, self.y, z).plot(self.ax, aggregate=True, statistic='max')
+        self.assertEqual(np.nanmax(im.get_array()), 1)
+        self.assertEqual(self.ax.collections[:], [])
+
+    def test_aspect(self):
+        self.ax.set_aspect('equal')
+        datasets.Points(self.x, self.y).plot(self.ax, aggregate=True)
+        self.assertEqual(self.ax.get_aspect(), 1)
+
+    def test_statistic(self):
+        points = datasets.Points(self.x, self.y)
+        with self.assertRaises(ValueError):
+            points.rasterize((0, 1), (0, 1), (10, 10), statistic='mean')
+
+
+class TestVectorDataThinning(unittest.TestCase):
+
+    def setUp(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig = Figure(figsize=(2, 2), dpi=50)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0, 0, 1, 1])
+        self.x = np.arange(1000.)
+        self.y = np.arange(500.)
+        self.u = np.add.outer(self.y, self.x)
+        self.data = datasets.VectorData(self.x, self.y, self.u, -self.u)
+
+    def test_thinned(self):
+        x, y, u, v = self.data.thinned((10, 20))
+        self.assertEqual(u.shape, (50, 50))
+        self.assertEqual(x[1], 20)
+        x, y, u, v = self.data.thinned((3, 3), (0, 5), (0, 5), thinning='mean')
+        self.assertEqual(u.shape, (2, 2))
+        self.assertEqual(x.tolist(), [1, 3.5])
+        self.assertEqual(u[1, 1], self.u[3:5, 3:5].mean())
+        self.assertEqual(v[0, 0], -self.u[:3, :3].mean())
+
+    def test_bounded(self):
+        quiver, = self.data.plot(self.ax, spacing=10)
+        self.assertLessEqual(quiver.N, 11*11)
+        # the arrows are selected for the autoscaled view of the entire grid
+        self.assertEqual((quiver.X.min(), quiver.Y.min()), (0, 0))
+        self.assertGreaterEqual(quiver.X.max(), 900)
+        self.assertEqual(len(self.data.plot(self.ax, spacing=0)[0].U), self.u.size)
+
+    def test_zoom(self):
+        artists = self.data.plot(self.ax, spacing=10)
+        self.canvas.draw()
+        quiver, = artists
+        self.ax.set_xlim(100, 150)
+        self.ax.set_ylim(100, 150)
+        self.canvas.draw()
+        zoomed, = artists
+        self.assertIsNot(zoomed, quiver)
+        # the start of the window is aligned to the stride (6)
+        self.assertEqual(zoomed.X.min(), 96)
+        # the replaced quiver is removed after the draw and the arrows keep their scale
+        self.assertNotIn(quiver, self.ax.collections)
+        self.assertIn(zoomed, self.ax.collections)
+        self.assertEqual(zoomed.scale, quiver.scale)
+        self.assertEqual(self.ax.collections[:], [zoomed])
+
+
+class TestPointsNearest(unittest.TestCase):
+
+    def test_nearest(self):
+        points = datasets.ValuePoints(np.array([0., 1, 2]), np.array([0., 10, 0]), np.array([5., 6, 7]))
+        self.assertEqual(points.nearest(1, 4)[0], 0)
+        self.assertEqual(points.nearest(1, 4, scale=(10, 1))[0], 1)
+        self.assertIs(points.spatial_index(), points.spatial_index())
+        points.invalidate()
+        self.assertIsNone(points.nearest(1, 4, maxdist=1))
+
+
+class TestReadout(unittest.TestCase):
+
+    def test_nearest_index(self):
+        v = np.arange(10.)*2
+        for equidistant in (True, False):
+            self.assertEqual(datasets._nearest_index(v, 6.9, equidistant, True), 3)
+            self.assertEqual(datasets._nearest_index(v, -.9, equidistant, True), 0)
+            self.assertIsNone(datasets._nearest_index(v, 19.1 + 1, equidistant, True))
+        self.assertEqual(datasets._nearest_index(v[::-1], 6.9, True, False), 6)
+        self.assertIsNone(datasets._nearest_index(v[::-1], 6.9, False, False))
+
+    def test_grid(self):
+        x, y = np.array([0., 1, 3, 7]), np.arange(3.)
+        z = np.arange(12.).reshape(3, 4)
+        grid = datasets.Grid(x, y, z)
+        self.assertEqual(grid.readout(2.9, 1.2), [('x', 3), ('y', 1), ('z', 6)])
+        self.assertIsNone(grid.readout(2.9, 5))
+        u = z.copy()
+        vectors = datasets.VectorData(x, y, u, -u)
+        self.assertEqual(vectors.index_at(7.5, 0), (3, 0, (0, 3), (0, 3)))
+
+    def test_timeseries(self):
+        ts = datasets.Timeseries(np.arange(100.)**2, np.arange(100.))
+        self.assertEqual(ts.readout(50, 1000), [('t', 49), ('v', 7)])
+        self.assertEqual(ts.readout(50, 7.5, maxdist=5), [('t', 49), ('v', 7)])
+        self.assertIsNone(ts.readout(50, 1000, maxdist=5))
+        self.assertIsNone(ts.readout(56, 7, maxdist=5))
+        self.assertIsNone(datasets.Timeseries(np.random.rand(10), np.random.rand(10)).index_at(.5, 0))
+
+    def test_timeseries_envelope(self):
+        t = np.arange(100000.)
+        ts = datasets.Timeseries(t, np.sin(t/10))
+        # 20000 samples within maxdist of x: only the samples of partial blocks are compared
+        self.assertEqual(ts.index_at(50000.2, .5, scale=(.001, 1), maxdist=10), (50000, 50000))
+        self.assertIsNone(ts.index_at(50000.2, 12, scale=(.001, 1), maxdist=10))
+        self.assertIsNone(ts.index_at(50000.2, -12, scale=(.001, 1), maxdist=10))
+        self.assertEqual(ts._envelope(1000, 5000), tuple(datasets.nanminmax(ts.axes[1][1000:5000])))
+        self.assertEqual(ts._envelope(1000, 1010), tuple(datasets.nanminmax(ts.axes[1][1000:1010])))
+
+    def test_points(self):
+        points = datasets.Points(np.array([0., 1]), np.array([0., 1]))
+        self.assertEqual(points.readout(.9, .9, maxdist=1), [('x', 1), ('y', 1)])
+        self.assertIsNone(points.readout(.5, .5, scale=(10, 10), maxdist=1))
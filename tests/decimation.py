@@ -0,0 +1,37 @@
+import unittest
+from easyplot import decimation
+import numpy as np
+
+
+class TestDecimation(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.linspace(0, 100, 100001)
+        self.y = np.sin(self.x)
+        self.y[5000] = 10
+        self.y[70000] = -10
+
+    def test_lttb(self):
+        x, y = decimation.lttb(self.x, self.y, 1000)
+        self.assertEqual(x.size, 1000)
+        self.assertEqual((x[0], x[-1]), (self.x[0], self.x[-1]))
+        self.assertTrue((np.diff(x) > 0).all())
+        self.assertIn(10, y)
+        self.assertIn(-10, y)
+
+    def test_minmax(self):
+        x, y = decimation.minmax(self.x, self.y, 1000)
+        self.assertEqual(x.size, 1000)
+        self.assertTrue((np.diff(x) > 0).all())
+        self.assertEqual(y.max(), 10)
+        self.assertEqual(y.min(), -10)
+
+    def test_small(self):
+        x, y = decimation.decimate(self.x[:10], self.y[:10], 1000, method='lttb')
+        self.assertEqual(x.size, 10)
+        x, y = decimation.decimate(self.x[:10], self.y[:10], 1000, method='minmax')
+        self.assertEqual(x.size, 10)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            decimation.decimate(self.x, self.y, 10, method='unknown')
@@ -0,0 +1,58 @@
+import unittest
+import subprocess
+import sys
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+
+# maximum time for importing the modules used without gui, numpy included
+IMPORT_BUDGET = 1.
+
+
+def import_in_subprocess(*modules):
+    """
+    import modules in a new interpreter
+    :return: (import time in seconds, names of the imported modules)
+    """
+    code = '\n'.join([
+        'import json, sys, time',
+        't0 = time.perf_counter()',
+        'import {}'.format(', '.join(modules)),
+        'print(json.dumps([time.perf_counter() - t0, sorted(sys.modules)]))'])
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return json.loads(out.decode('utf-8'))
+
+
+class TestImports(unittest.TestCase):
+
+    def test_datasets(self):
+        elapsed, modules = import_in_subprocess('easyplot.datasets')
+        self.assertFalse([m for m in modules if m.startswith('matplotlib')])
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_managers(self):
+        elapsed, modules = import_in_subprocess('easyplot.managers', 'easyplot.session', 'easyplot.channel')
+        self.assertNotIn('matplotlib.pyplot', modules)
+        self.assertNotIn('PyQt4', modules)
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_batch_cli(self):
+        # rendering must not depend on modules imported by other tests, e.g. matplotlib.style via pyplot
+        directory = tempfile.mkdtemp()
+        try:
+            layout = os.path.join(directory, 'layout.json')
+            with open(layout, 'w') as f:
+                json.dump(dict(style='default', layers=[dict(arrays=['t', 'v'])]), f)
+            data = os.path.join(directory, 'series.npz')
+            np.savez(data, t=np.linspace(0, 1, 100), v=np.random.rand(100))
+            outdir = os.path.join(directory, 'out')
+            result = subprocess.run([sys.executable, '-m', 'easyplot', 'render', layout, data, '-o', outdir, '-j', '1'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            output = os.path.join(outdir, 'series.png')
+            self.assertTrue(os.path.exists(output))
+            self.assertIn('{} -> {}'.format(data, output), result.stdout.decode('utf-8'))
+        finally:
+            shutil.rmtree(directory)
@@ -85,6 +85,56 @@ class TestLayerContainer(unittest.TestCase):
             self.container.order([0, 1, 2])
 
 
+    def testPlotIncremental(self):
+        self.create_container()
+        grid, lines = self.container.plot(self.ax)
+        line = lines[0]
+
+        # kwargs with a setter are applied to the existing artists
+        self.container.edit(1, color='r', lw=3)
+        self.container.edit(0, alpha=.5)
+        new_grid, new_lines = self.container.plot(self.ax)
+        self.assertIs(new_grid, grid)
+        self.assertIs(new_lines[0], line)
+        self.assertEqual(line.get_color(), 'r')
+        self.assertEqual(line.get_linewidth(), 3)
+        self.assertEqual(grid.get_alpha(), .5)
+
+        # other kwargs require the layer to be plotted again
+        self.container.edit(1, decimate='minmax')
+        _, new_lines = self.container.plot(self.ax)
+        self.assertIsNot(new_lines[0], line)
+        self.assertNotIn(line, self.ax.lines)
+        self.assertIn(new_lines[0], self.ax.lines)
+
+        # a layer plotted again keeps the color it got from the property cycle
+        c = managers.LayersContainer(create_timeseries_dataset(), create_timeseries_dataset())
+        first, second = [lines[0].get_color() for lines in c.plot(self.ax)]
+        self.assertNotEqual(first, second)
+        c.edit(0, decimate='minmax')
+        c.edit(1, decimate='minmax')
+        self.assertEqual([lines[0].get_color() for lines in c.plot(self.ax)], [first, second])
+
+        # the settings panel sends all fields, only changed values count
+        c = managers.LayersContainer(create_timeseries_dataset(), create_grid_dataset())
+        c.current_index = 0
+        c.edit_current(color='r', yautoscale=False)
+        line = c.plot(self.ax)[0][0]
+        c.edit_current(color='b', yautoscale=False)
+        self.assertIs(c.plot(self.ax)[0][0], line)
+        self.assertEqual(line.get_color(), 'b')
+        c.current_index = 1
+        c.edit_current(cmap='viridis', method='imshow')
+        image = c.plot(self.ax)[1]
+        c.edit_current(cmap='jet', method='imshow')
+        self.assertIs(c.plot(self.ax)[1], image)
+        self.assertEqual(image.get_cmap().name, 'jet')
+
+        # artists of deleted layers are removed
+        self.container.delete(0)
+        self.container.plot(self.ax)
+        self.assertNotIn(grid, self.ax.collections)
+
     def tearDown(self):
         plt.close(self.fig)
 
@@ -115,6 +165,17 @@ class TestAxesManager(unittest.TestCase):
         self.m.set_position(.1, .1, .8, .8)
         self.assertEqual(self.m.position, [.1, .1, .8, .8])
 
+    def testPlot(self):
+        self.create_axmanager()
+        self.m.layers.add(create_timeseries_dataset())
+        self.m.plot()
+        line, = self.ax.lines
+        self.m.plot()
+        self.assertEqual(self.ax.lines[:], [line])
+        self.m.plot(reset=True)
+        self.assertEqual(len(self.ax.lines), 1)
+        self.assertIsNot(self.ax.lines[0], line)
+
 
 class TestFigManager(unittest.TestCase):
 
@@ -128,4 +189,44 @@ class TestFigManager(unittest.TestCase):
         self.assertEqual(len(m.axes), 1)
         self.assertIsInstance(m.gca(), managers.AxesManager)
         for a in m.axes:
-            self.assertIsInstance(a, managers.AxesManager)
\ No newline at end of file
+            self.assertIsInstance(a, managers.AxesManager)
+
+    def testSetAxCount(self):
+        m = managers.FigureManager(self.fig)
+        m.gca().layers.add(create_timeseries_dataset())
+        m.gca().format(xlabel='x')
+        m.gca().plot()
+        ax = m.gca().ax
+        line, = ax.lines
+
+        # existing axes are moved and keep their artists
+        m.set_ax_count(3, reset=False)
+        self.assertEqual(len(m.axes), 3)
+        self.assertEqual(len(self.fig.axes), 3)
+        self.assertIs(m.axes[0].ax, ax)
+        self.assertEqual(ax.lines[:], [line])
+        self.assertEqual(ax.get_xlabel(), 'x')
+        x0, _, w0, _ = m.axes[0].position
+        x1, _, w1, _ = m.axes[1].position
+        self.assertLess(x0 + w0, x1)
+
+        m.set_ax_count(1, reset=False)
+        self.assertEqual(self.fig.axes, [ax])
+        self.assertEqual(ax.lines[:], [line])
+
+        m.set_ax_count(2)
+        self.assertEqual(len(self.fig.axes), 2)
+        self.assertNotIn(ax, self.fig.axes)
+        self.assertEqual(len(m.gca().layers), 0)
+
+    def testSetAxrowCount(self):
+        m = managers.FigureManager(self.fig)
+        m.set_ax_count(4, reset=False)
+        axes = [a.ax for a in m.axes]
+        m.set_axrow_count(2, reset=False)
+        self.assertEqual([a.ax for a in m.axes], axes)
+        # 2x2 grid
+        x0, y0, _, _ = m.axes[0].position
+        x2, y2, _, _ = m.axes[2].position
+        self.assertAlmostEqual(x0, x2)
+        self.assertGreater(y0, y2)
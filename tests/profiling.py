@@ -0,0 +1,59 @@
+import unittest
+from easyplot import profiling, datasets, rendering
+from easyplot.managers import FigureManager
+import numpy as np
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        profiling.registry.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.registry.reset()
+
+    def test_stats(self):
+        s = profiling.Stats()
+        for v in range(1, 101):
+            s.add(v)
+        summary = s.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['total'], 5050)
+        self.assertEqual(summary['p50'], 51)
+        self.assertEqual(summary['p95'], 95)
+
+    def test_disabled(self):
+        with profiling.timed('x'):
+            pass
+        self.assertEqual(profiling.registry.summary(), dict())
+        profiling.enable()
+        with profiling.timed('x'):
+            pass
+        self.assertEqual(profiling.registry.summary()['x']['count'], 1)
+
+    def test_layers(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        profiling.enable()
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        figman = FigureManager(fig)
+        axman = figman.axes[0]
+        axman.layers.add(datasets.Timeseries(np.arange(10.), np.random.rand(10)))
+        axman.layers.add(datasets.Grid(np.arange(10.), np.arange(5.), np.random.rand(5, 10)))
+        axman.plot()
+        fig.canvas.draw()
+
+        summary = profiling.registry.summary()
+        for k in ('Dataset.plot', 'LayersContainer.plot', 'AxesManager.plot', 'AxesManager.apply_settings'):
+            self.assertIn(k, summary)
+        self.assertEqual(summary['Dataset.plot']['count'], 2)
+        layers = profiling.registry.summary(prefix=profiling.LAYER_PREFIX)
+        self.assertEqual(sorted(layers), ['draw {} 0 timeseries.plot'.format(axman.label()),
+                                        'draw {} 1 grid.pcolormesh'.format(axman.label())])
+
+        # a copy of the figure records its draws under the same names
+        rendering.render_rgba(figman.snapshot())
+        for k, v in profiling.registry.summary(prefix=profiling.LAYER_PREFIX).items():
+            self.assertEqual(v['count'], 2)
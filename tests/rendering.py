@@ -0,0 +1,50 @@
+import unittest
+from easyplot import datasets, managers, rendering
+from matplotlib.figure import Figure
+import numpy as np
+
+
+class TestRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.fig = Figure(figsize=(4, 3), dpi=50)
+        self.figman = managers.FigureManager(self.fig)
+        t = np.linspace(0, 1, 10000)
+        self.dataset = datasets.Timeseries(t, np.sin(20*t))
+        self.figman.gca().layers.add(self.dataset, decimate='minmax')
+        self.figman.gca().plot()
+
+    def test_snapshot(self):
+        copy = self.figman.snapshot()
+        self.assertIsNot(copy, self.fig)
+        line, = self.fig.axes[0].lines
+        copied_line, = copy.axes[0].lines
+        self.assertIsNot(copied_line, line)
+
+        # the copy updates its own artists and shares the dataset arrays
+        updater, = copy.axes[0].artists
+        self.assertIs(updater.artist, copied_line)
+        self.assertIs(updater.func.func.__self__, self.dataset)
+        self.assertIs(updater.dataset, self.dataset)
+        # the data of the artists is shared as well
+        self.assertIs(copied_line.get_xydata(), line.get_xydata())
+
+        copy.axes[0].set_xlim(0, .5)
+        rendering.render_rgba(copy)
+        self.assertLessEqual(copied_line.get_xdata().max(), .51)
+        self.assertEqual(line.get_xdata().max(), 1)
+
+    def test_render(self):
+        rgba = rendering.render_rgba(self.figman.snapshot())
+        self.assertEqual(rgba.shape, (150, 200, 4))
+        self.assertEqual(rgba.dtype, np.uint8)
+        argb = rendering.rgba_to_argb32(rgba)
+        np.testing.assert_array_equal(argb[..., 0], rgba[..., 2])
+        self.assertTrue(argb.flags['C_CONTIGUOUS'])
+
+    def test_colormap_gradient(self):
+        gradient = rendering.colormap_gradient('viridis', width=10, height=3)
+        self.assertEqual(gradient.shape, (3, 10, 4))
+        self.assertEqual(gradient.dtype, np.uint8)
+        np.testing.assert_array_equal(gradient[0], gradient[2])
+        self.assertEqual(tuple(gradient[0, 0]), tuple(rendering.colormap_gradient('viridis_r', 10, 3)[0, -1]))
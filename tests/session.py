@@ -0,0 +1,84 @@
+import unittest
+import tempfile
+import shutil
+import os
+from easyplot import datasets, managers, session
+from matplotlib.figure import Figure
+import numpy as np
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'session.ep')
+
+        self.figman = managers.FigureManager(Figure())
+        self.figman.set_ax_count(2)
+        x = np.linspace(0, 1, 30)
+        y = np.linspace(0, 2, 20)
+        self.grid = datasets.Grid(x, y, np.asfortranarray(np.random.rand(20, 30)))
+        self.ts = datasets.Timeseries(x, np.random.rand(30).astype(np.float32))
+        self.figman.axes[0].layers.add(self.grid, vmin=.2)
+        self.figman.axes[1].layers.add(self.ts, color=(1., 0., 0.), decimate='lttb')
+        self.figman.axes[1].format(xlabel='t', xlim=np.array([0, 1]))
+        self.figman.current_index = 1
+
+    def test_roundtrip(self):
+        session.save(self.figman, self.path)
+        figman = session.load(self.path, Figure())
+
+        self.assertEqual(figman.ax_count(), 2)
+        self.assertEqual(figman.current_index, 1)
+        for a, b in zip(figman.axes, self.figman.axes):
+            np.testing.assert_allclose(a.position, b.position)
+
+        axman = figman.axes[1]
+        self.assertEqual(axman.ax.get_xlabel(), 't')
+        self.assertEqual(tuple(axman.ax.get_xlim()), (0, 1))
+        layer = axman.layers[0]
+        self.assertIsInstance(layer['data'], datasets.Timeseries)
+        self.assertEqual(layer['kwargs'], dict(color=[1., 0., 0.], decimate='lttb'))
+        self.assertEqual(layer['data'].axes[1].dtype, np.float32)
+
+        grid = figman.axes[0].layers[0]['data']
+        self.assertEqual(figman.axes[0].layers[0]['kwargs'], dict(vmin=.2, cmap='viridis'))
+        for a, b in zip(grid.axes, self.grid.axes):
+            self.assertIsInstance(a.base, np.memmap)
+            self.assertEqual(a.ctypes.data % session.ALIGNMENT, 0)
+            np.testing.assert_array_equal(a, b)
+
+        # shared arrays are stored once
+        self.assertIs(grid.axes[0], figman.axes[1].layers[0]['data'].axes[0])
+
+        for a in figman.axes:
+            a.plot()
+
+    def test_streaming(self):
+        stream = datasets.StreamingTimeseries(20, np.arange(30.), np.arange(30.)**2)
+        self.figman.axes[0].layers.add(stream)
+        session.save(self.figman, self.path)
+        loaded = session.load(self.path, Figure()).axes[0].layers[1]['data']
+        self.assertIsInstance(loaded, datasets.StreamingTimeseries)
+        self.assertEqual(loaded.capacity, 20)
+        np.testing.assert_array_equal(loaded.axes[1], stream.axes[1])
+        loaded.append([30.], [0.])
+        self.assertEqual(len(loaded), 20)
+
+    def test_failed_save(self):
+        session.save(self.figman, self.path)
+        self.figman.axes[1].layers.edit(0, marker=object())
+        with self.assertRaises(TypeError):
+            session.save(self.figman, self.path)
+        # the previous session is kept and no temporary file is left behind
+        self.assertEqual(os.listdir(self.dir), ['session.ep'])
+        self.assertEqual(session.load(self.path, Figure()).ax_count(), 2)
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a session file at all')
+        with self.assertRaises(session.InvalidSessionFile):
+            session.load(self.path, Figure())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
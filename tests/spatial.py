@@ -0,0 +1,48 @@
+import unittest
+from easyplot import spatial
+import numpy as np
+
+
+class TestGridIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.x = rng.rand(20000)*100
+        self.y = rng.rand(20000)
+        self.x[:10] = np.nan
+        self.index = spatial.GridIndex(self.x, self.y)
+
+    def brute_force(self, x, y, scale):
+        d = np.hypot((self.x - x)*scale[0], (self.y - y)*scale[1])
+        i = np.nanargmin(d)
+        return i, d[i]
+
+    def test_nearest(self):
+        for x, y, scale in ((50, .5, (1, 1)), (10, .1, (1, 100)), (-20, 2, (.1, 1000)), (99.9, .99, (3, 3))):
+            i, d = self.index.nearest(x, y, scale=scale)
+            j, e = self.brute_force(x, y, scale)
+            self.assertEqual(i, j)
+            self.assertAlmostEqual(d, e)
+
+    def test_maxdist(self):
+        self.assertIsNone(self.index.nearest(-20, .5, maxdist=10))
+        i, d = self.index.nearest(-20, .5, maxdist=30)
+        self.assertLess(d, 30)
+
+    def test_degenerate(self):
+        self.assertIsNone(spatial.GridIndex(np.array([np.nan]), np.array([1.])).nearest(0, 0))
+        index = spatial.GridIndex(np.arange(10.), np.zeros(10))
+        self.assertEqual(index.nearest(3.2, 5)[0], 3)
+
+    def test_clustered(self):
+        rng = np.random.RandomState(1)
+        x, y = rng.rand(2, 20000)*1e-3
+        x[:100], y[:100] = rng.rand(2, 100)*100
+        index = spatial.GridIndex(x, y)
+        # most cells hold points of the cluster, so a search in the cluster only visits a few of its points
+        self.assertLess(np.diff(index.offsets).max(), 1000)
+        for px, py, scale in ((5e-4, 5e-4, (1, 1)), (50, 50, (1, 1)), (1e-3, 2e-3, (1e5, 1e5))):
+            i, d = index.nearest(px, py, scale=scale)
+            e = np.hypot((x - px)*scale[0], (y - py)*scale[1])
+            self.assertEqual(i, np.argmin(e))
+            self.assertAlmostEqual(d, e.min())
@@ -0,0 +1,63 @@
+import unittest
+import tempfile
+import shutil
+import os
+from easyplot import storage, datasets
+import numpy as np
+
+
+class TestStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.x = np.linspace(0, 1, 20)
+        self.y = np.linspace(0, 2, 10)
+        self.z = np.random.rand(10, 20)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_npy(self):
+        paths = []
+        for name, a in zip('xyz', (self.x, self.y, self.z)):
+            paths.append(self.path(name + '.npy'))
+            np.save(paths[-1], a)
+        d = datasets.Grid.from_npy(*paths)
+        self.assertIsInstance(d.axes[2], np.memmap)
+        np.testing.assert_array_equal(d.axes[2], self.z)
+
+    def test_npz(self):
+        path = self.path('grid.npz')
+        np.savez(path, z=self.z, x=self.x, y=self.y)
+        arrays = storage.load_npz(path)
+        self.assertEqual(list(arrays), ['z', 'x', 'y'])
+        d = datasets.Grid.from_npz(path)
+        for a, b in zip(d.axes, (self.x, self.y, self.z)):
+            self.assertIsInstance(a, np.memmap)
+            np.testing.assert_array_equal(a, b)
+
+        fortran = self.path('fortran.npz')
+        np.savez(fortran, z=np.asfortranarray(self.z))
+        np.testing.assert_array_equal(storage.load_npz(fortran)['z'], self.z)
+
+    def test_npz_compressed(self):
+        path = self.path('grid.npz')
+        np.savez_compressed(path, x=self.x, y=self.y, z=self.z)
+        d = datasets.Grid.from_npz(path)
+        self.assertNotIsInstance(d.axes[2], np.memmap)
+        np.testing.assert_array_equal(d.axes[2], self.z)
+
+    def test_interpret(self):
+        path = self.path('grid.npz')
+        np.savez(path, x=self.x, y=self.y, z=self.z)
+        d = datasets.interpret_datatype(path, mmap=True)
+        self.assertIsInstance(d, datasets.Grid)
+        self.assertIsInstance(d.axes[2], np.memmap)
+
+    def test_buffer(self):
+        buf = memoryview(self.x)
+        d = datasets.Timeseries(buf, self.x)
+        self.assertTrue(np.shares_memory(d.axes[0], self.x))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)